@@ -17,7 +17,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 from quickbooks_autoreport.dashboard.charts_display import (
     render_charts_section,
 )
-from quickbooks_autoreport.dashboard.config import OUTPUT_DIR
+from quickbooks_autoreport.dashboard.config import (
+    OUTPUT_DIR,
+    PREFETCH_ENABLED,
+)
 from quickbooks_autoreport.dashboard.data_loader import (
     ExcelLoader,
     FileScanner,
@@ -74,6 +77,9 @@ def initialize_session_state() -> None:
         st.session_state.dashboard_state = DashboardState()
         logger.info("📥 Initialized dashboard session state")
 
+    # Sidebar file selection is remembered by filename
+    st.session_state.setdefault("selected_filename", None)
+
 
 # ============================================================================
 # File Selection Logic (Sub-task 9.2)
@@ -264,6 +270,48 @@ def load_data(
         st.session_state.success_message = None
 
 
+def prefetch_next_file(
+    file_scanner: FileScanner,
+    excel_loader: ExcelLoader,
+    state: DashboardState,
+) -> None:
+    """
+    Warm the load cache for the newest file that is not displayed.
+
+    Streamlit reruns the script on every interaction, so the file and
+    modification time last prefetched are kept in session state and
+    each version of a file is only submitted once.
+
+    Args:
+        file_scanner: FileScanner instance for discovering files
+        excel_loader: ExcelLoader instance for loading data
+        state: Current dashboard state
+    """
+    if not PREFETCH_ENABLED:
+        return
+
+    try:
+        candidates = [
+            path
+            for path in file_scanner.list_excel_files()[:2]
+            if path != state.current_file
+        ]
+        if not candidates:
+            return
+
+        next_file = candidates[0]
+        prefetch_key = (str(next_file), next_file.stat().st_mtime)
+        if st.session_state.get("prefetched_file") == prefetch_key:
+            return
+
+        st.session_state.prefetched_file = prefetch_key
+        excel_loader.prefetch_file(next_file, prefetch_key[1])
+
+    except Exception as e:
+        # Prefetching is best effort and must never break the page
+        log_error(logger, f"Prefetch error: {str(e)}")
+
+
 # ============================================================================
 # Manual Refresh Functionality (Sub-task 9.4)
 # ============================================================================
@@ -412,7 +460,8 @@ def main() -> None:
     4. Handle manual refresh
     5. Check for file modifications (polling)
     6. Load data if needed
-    7. Render dashboard content
+    7. Prefetch the next most recent file
+    8. Render dashboard content
 
     Requirements:
         - 8.1: Set page configuration, initialize session state, add title
@@ -440,6 +489,9 @@ def main() -> None:
     # Load data if needed (Sub-task 9.3)
     load_data(excel_loader, state)
 
+    # Warm the cache for the next most recent file
+    prefetch_next_file(file_scanner, excel_loader, state)
+
     # Render dashboard content (Sub-task 9.6)
     render_dashboard_content(state)
 
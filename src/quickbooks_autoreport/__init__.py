@@ -22,13 +22,6 @@ from .config import (
     get_file_paths,
 )
 
-# Core services
-from .services import (
-    export_report,
-    export_all_reports,
-    diagnose_quickbooks_connection,
-    test_xml_generation,
-)
 
 # Utilities
 from .utils import (
@@ -75,4 +68,24 @@ __all__ = [
     "log_progress",
     "log_data",
     "log_separator",
-]
\ No newline at end of file
+]
+
+
+# Core services, resolved lazily through the services package so that
+# importing the package (e.g. for the GUI) does not load the COM layer
+_LAZY_SERVICES = frozenset({
+    "export_report",
+    "export_all_reports",
+    "diagnose_quickbooks_connection",
+    "test_xml_generation",
+})
+
+
+def __getattr__(name):
+    """Resolve core service names from the services package on demand."""
+    if name in _LAZY_SERVICES:
+        from . import services
+        value = getattr(services, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
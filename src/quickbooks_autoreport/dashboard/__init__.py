@@ -6,7 +6,7 @@ and UI components for the Streamlit sales dashboard.
 """
 
 from .charts import ChartGenerator
-from .data_loader import ExcelLoader, FileScanner
+from .data_loader import ExcelLoader, FileInfo, FileScanner
 from .metrics import MetricsCalculator
 from .sidebar import (
     render_sidebar,
@@ -22,6 +22,7 @@ __version__ = "0.1.0"
 __all__ = [
     "ChartGenerator",
     "ExcelLoader",
+    "FileInfo",
     "FileScanner",
     "MetricsCalculator",
     "render_sidebar",
@@ -23,6 +23,16 @@ REQUIRED_COLUMNS: List[str] = [
     'Sales_Amount',
     'Sales_Qty'
 ]
+# Columns read from the sheet: required columns plus optional columns
+# consumed by metrics and date-range lookups. Others are never parsed.
+LOADED_COLUMNS: List[str] = REQUIRED_COLUMNS + [
+    'Transaction_Total',
+    'Net_Amount',
+    'Net_Qty',
+    'date',
+    'Transaction_Date',
+    'transaction_date'
+]
 
 # Display Configuration
 TOP_N_PRODUCTS: int = 5
@@ -43,6 +53,9 @@ WEEKDAY_ORDER: List[str] = [
 # Performance Configuration
 MAX_FILE_SIZE_MB: int = 10
 CACHE_TTL_SECONDS: int = 300  # 5 minutes
+FILE_LIST_CACHE_TTL_SECONDS: int = 60  # 1 minute
+LOAD_CACHE_MAX_ENTRIES: int = 8  # Loaded DataFrames (few files x 2 versions)
+PREFETCH_ENABLED: bool = True  # Warm the cache for the next file
 
 # Logging Configuration
 LOG_EMOJI_LOADING: str = "📥"
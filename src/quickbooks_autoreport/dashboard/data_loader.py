@@ -5,24 +5,375 @@ This module provides classes for discovering Excel files and loading
 sales data with validation.
 """
 
+import hashlib
+import importlib.util
+import io
 import logging
+import os
+import stat
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import AbstractSet, List, Optional, Tuple
 
 import pandas as pd
 import streamlit as st
 
 from .config import (
+    FILE_LIST_CACHE_TTL_SECONDS,
+    LOAD_CACHE_MAX_ENTRIES,
+    LOADED_COLUMNS,
     OUTPUT_DIR,
     REQUIRED_COLUMNS,
     SHEET_NAME,
     LOG_EMOJI_LOADING,
     LOG_EMOJI_ERROR,
+    LOG_EMOJI_WARNING,
 )
 
 logger = logging.getLogger(__name__)
 
+# Loaded DataFrames are cached as Parquet next to the workbook when
+# pyarrow is available
+PARQUET_CACHE_ENABLED: bool = (
+    importlib.util.find_spec("pyarrow") is not None
+)
+
+# Prefer the Rust-based calamine reader (pandas >= 2.2) and fall back
+# to openpyxl, which pandas already opens in read-only mode
+EXCEL_ENGINE: str = (
+    "calamine"
+    if importlib.util.find_spec("python_calamine") is not None
+    else "openpyxl"
+)
+
+# Single background worker used to warm the load cache for files the
+# user is likely to open next. The worker carries no ScriptRunContext:
+# _load_excel_cached is a global (not session-scoped) st.cache_data
+# cache and emits no st.* elements, so it can be filled outside a
+# script run, and a pooled thread never holds a finished run's context
+_prefetch_executor = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="excel-prefetch"
+)
+
+
+@st.cache_data(ttl=FILE_LIST_CACHE_TTL_SECONDS, show_spinner=False)
+def _scan_excel_files(
+    directory: str, directory_mtime_ns: int
+) -> List[Tuple[float, str, int]]:
+    """
+    Scan a directory for Excel files with caching.
+
+    Args:
+        directory: Path of directory to scan
+        directory_mtime_ns: Directory modification time in nanoseconds
+            (used for cache key)
+
+    Returns:
+        List of (mtime, path, size) tuples for .xlsx files, excluding
+        temporary Excel files (~$), sorted by modification time
+        (newest first)
+    """
+    # DirEntry.stat() caches its result, so each file is stat'ed
+    # once; the sort then compares the precomputed tuples
+    entries = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            if (
+                entry.name.endswith(".xlsx")
+                and not entry.name.startswith("~$")
+                and entry.is_file()
+            ):
+                entry_stats = entry.stat()
+                entries.append(
+                    (entry_stats.st_mtime, entry.path, entry_stats.st_size)
+                )
+
+    # Sort by modification time, newest first
+    entries.sort(reverse=True)
+    return entries
+
+
+@dataclass(frozen=True)
+class FileInfo:
+    """
+    Stat metadata for an Excel file captured during a directory scan.
+
+    Attributes:
+        path: Path to the file
+        size: File size in bytes
+        mtime: Last modification time as a POSIX timestamp
+    """
+    path: Path
+    size: int
+    mtime: float
+
+    @property
+    def name(self) -> str:
+        """Return the filename."""
+        return self.path.name
+
+
+def _parquet_cache_prefix(filepath: Path, columns: AbstractSet[str]) -> str:
+    """
+    Build the Parquet sidecar name prefix for an Excel file and column set.
+
+    Only the requested columns are parsed from the workbook, so the
+    column set is part of the sidecar name; loaders with different
+    required columns never share a cached frame.
+
+    Args:
+        filepath: Path to Excel file
+        columns: Columns parsed from the workbook
+
+    Returns:
+        Sidecar file name prefix ("<stem>.<columns digest>.")
+    """
+    digest = hashlib.sha1(
+        "\0".join(sorted(columns)).encode("utf-8")
+    ).hexdigest()[:12]
+    return f"{filepath.stem}.{digest}."
+
+
+def _parquet_cache_path(
+    filepath: Path, columns: AbstractSet[str], source: os.stat_result
+) -> Path:
+    """
+    Build the Parquet sidecar path for one version of an Excel file.
+
+    The exact modification time and size of the workbook are part of
+    the name, so a replaced workbook never matches an older sidecar,
+    even when the replacement carries an older mtime (e.g. a restored
+    backup or an Explorer copy).
+
+    Args:
+        filepath: Path to Excel file
+        columns: Columns parsed from the workbook
+        source: Stat result of the workbook
+
+    Returns:
+        Path of the sidecar next to the Excel file
+    """
+    return filepath.with_name(
+        f"{_parquet_cache_prefix(filepath, columns)}"
+        f"{source.st_mtime_ns}-{source.st_size}.parquet"
+    )
+
+
+def _read_parquet_cache(
+    filepath: Path, columns: AbstractSet[str], source: os.stat_result
+) -> Optional[pd.DataFrame]:
+    """
+    Read the Parquet sidecar for this version of an Excel file.
+
+    Args:
+        filepath: Path to Excel file
+        columns: Columns parsed from the workbook
+        source: Stat result of the workbook
+
+    Returns:
+        Cached DataFrame, or None if there is no sidecar for this
+        version of the workbook or it cannot be read
+    """
+    if not PARQUET_CACHE_ENABLED:
+        return None
+
+    cache_path = _parquet_cache_path(filepath, columns, source)
+    try:
+        df = pd.read_parquet(cache_path, engine="pyarrow")
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(
+            f"{LOG_EMOJI_WARNING} Ignoring unreadable Parquet cache "
+            f"{cache_path.name}: {str(e)}"
+        )
+        return None
+
+    logger.info(
+        f"{LOG_EMOJI_LOADING} Loaded {len(df)} rows from Parquet "
+        f"cache {cache_path.name}"
+    )
+    return df
+
+
+def _write_parquet_cache(
+    filepath: Path,
+    df: pd.DataFrame,
+    columns: AbstractSet[str],
+    source: os.stat_result
+) -> None:
+    """
+    Write the Parquet sidecar for this version of an Excel file.
+
+    Sidecars of other versions of the workbook with the same column
+    set are removed. Failures are logged and ignored; the cache is an
+    optimization.
+
+    Args:
+        filepath: Path to Excel file
+        df: Loaded DataFrame to persist
+        columns: Columns parsed from the workbook
+        source: Stat result of the workbook
+    """
+    if not PARQUET_CACHE_ENABLED:
+        return
+
+    cache_path = _parquet_cache_path(filepath, columns, source)
+    prefix = _parquet_cache_prefix(filepath, columns)
+    try:
+        df.to_parquet(cache_path, engine="pyarrow", compression="snappy")
+        logger.debug(f"Wrote Parquet cache {cache_path.name}")
+        with os.scandir(filepath.parent) as it:
+            for entry in it:
+                if (
+                    entry.name.startswith(prefix)
+                    and entry.name.endswith(".parquet")
+                    and entry.name != cache_path.name
+                ):
+                    os.remove(entry.path)
+    except Exception as e:
+        logger.warning(
+            f"{LOG_EMOJI_WARNING} Failed to write Parquet cache "
+            f"{cache_path.name}: {str(e)}"
+        )
+
+
+# The cache key includes the file mtime, so entries never go stale and
+# can be kept for a day; every rewrite of a workbook adds a new entry,
+# so the entry count is bounded to evict superseded versions
+@st.cache_data(
+    ttl=24 * 60 * 60,
+    max_entries=LOAD_CACHE_MAX_ENTRIES,
+    show_spinner=False
+)
+def _load_excel_cached(
+    filepath_str: str,
+    file_mtime: float,
+    required_columns: Tuple[str, ...]
+) -> pd.DataFrame:
+    """
+    Load the Transactions sheet of an Excel file with caching.
+
+    Only primitive arguments are used so Streamlit can hash the cache
+    key cheaply.
+
+    Args:
+        filepath_str: Path to Excel file
+        file_mtime: File modification time (used for cache key)
+        required_columns: Columns that must be parsed in addition to
+            LOADED_COLUMNS
+
+    Returns:
+        pandas DataFrame containing the Excel data with optimized
+        data types
+
+    Raises:
+        FileNotFoundError: If file does not exist
+        ValueError: If file cannot be read or is empty
+    """
+    filepath = Path(filepath_str)
+    loaded_columns = frozenset(LOADED_COLUMNS).union(required_columns)
+
+    # Read the whole workbook with a single open instead of an
+    # exists() check followed by pandas opening the file again; this
+    # halves round-trips on network shares. The open file is stat'ed
+    # to find the Parquet sidecar of exactly this version.
+    try:
+        with open(filepath, "rb") as f:
+            source = os.fstat(f.fileno())
+            cached_df = _read_parquet_cache(filepath, loaded_columns, source)
+            if cached_df is not None:
+                return cached_df
+            buffer = io.BytesIO(f.read())
+    except FileNotFoundError as e:
+        error_msg = f"File not found: {filepath}"
+        logger.error(f"{LOG_EMOJI_ERROR} {error_msg}")
+        raise FileNotFoundError(error_msg) from e
+    except OSError as e:
+        # e.g. the workbook is locked while QuickBooks or Excel writes it
+        error_msg = (
+            f"Failed to read Excel file {filepath.name}: {str(e)}"
+        )
+        logger.error(f"{LOG_EMOJI_ERROR} {error_msg}")
+        raise ValueError(error_msg) from e
+
+    try:
+        logger.info(
+            f"{LOG_EMOJI_LOADING} Loading Excel file: "
+            f"{filepath.name} (mtime: {file_mtime})"
+        )
+
+        # Read Excel file from specific sheet, parsing only the
+        # columns the dashboard uses. Missing required columns are
+        # reported afterwards by validate_columns.
+        df = pd.read_excel(
+            buffer,
+            sheet_name=SHEET_NAME,
+            usecols=lambda column: column in loaded_columns,
+            engine=EXCEL_ENGINE
+        )
+
+        # Check if DataFrame is empty
+        if df.empty:
+            error_msg = f"Excel file sheet '{SHEET_NAME}' is empty: {filepath.name}"
+            logger.error(f"{LOG_EMOJI_ERROR} {error_msg}")
+            raise ValueError(error_msg)
+
+        # Optimize data types early for better performance
+        # Convert numeric columns to appropriate types
+        numeric_columns = [
+            'Sales_Amount',
+            'Sales_Qty',
+            'Net_Amount',
+            'Net_Qty'
+        ]
+
+        for col in numeric_columns:
+            if col in df.columns:
+                df[col] = pd.to_numeric(
+                    df[col],
+                    errors='coerce',
+                    downcast='float'
+                )
+                logger.debug(
+                    f"Converted column '{col}' to numeric type"
+                )
+
+        logger.info(
+            f"{LOG_EMOJI_LOADING} Loaded and optimized {len(df)} "
+            f"rows from {filepath.name}"
+        )
+        _write_parquet_cache(filepath, df, loaded_columns, source)
+        return df
+
+    except pd.errors.EmptyDataError as e:
+        error_msg = f"Excel file contains no data: {filepath.name}"
+        logger.error(f"{LOG_EMOJI_ERROR} {error_msg}")
+        raise ValueError(error_msg) from e
+
+    except Exception as e:
+        error_msg = (
+            f"Failed to read Excel file {filepath.name}: {str(e)}"
+        )
+        logger.error(f"{LOG_EMOJI_ERROR} {error_msg}")
+        raise ValueError(error_msg) from e
+
+
+def _log_prefetch_failure(future: "Future[pd.DataFrame]") -> None:
+    """
+    Log the error of a failed prefetch.
+
+    Args:
+        future: Completed prefetch future
+    """
+    error = future.exception()
+    if error is not None:
+        logger.warning(
+            f"{LOG_EMOJI_WARNING} Prefetch failed: {str(error)}"
+        )
+
 
 class FileScanner:
     """
@@ -56,32 +407,64 @@ class FileScanner:
         Raises:
             FileNotFoundError: If directory does not exist
         """
-        if not self.directory.exists():
+        excel_files = [Path(path) for _, path, _ in self._scan_directory()]
+
+        logger.info(
+            f"{LOG_EMOJI_LOADING} Found {len(excel_files)} Excel "
+            f"files in {self.directory}"
+        )
+        return excel_files
+
+    def list_excel_file_info(self) -> List[FileInfo]:
+        """
+        Scan directory for Excel files (.xlsx) with their metadata.
+
+        Size and modification time come from the same scandir pass
+        that lists the files, so rendering them needs no further
+        stat calls.
+
+        Returns:
+            List of FileInfo objects for .xlsx files found in directory,
+            sorted by modification time (newest first)
+
+        Raises:
+            FileNotFoundError: If directory does not exist
+        """
+        return [
+            FileInfo(path=Path(path), size=size, mtime=mtime)
+            for mtime, path, size in self._scan_directory()
+        ]
+
+    def _scan_directory(self) -> List[Tuple[float, str, int]]:
+        """
+        Validate the directory and return its cached Excel file scan.
+
+        Returns:
+            List of (mtime, path, size) tuples, newest first
+
+        Raises:
+            FileNotFoundError: If directory does not exist
+            NotADirectoryError: If path is not a directory
+        """
+        # One stat answers exists/is_dir and provides the cache key
+        try:
+            directory_stats = os.stat(self.directory)
+        except FileNotFoundError as e:
             error_msg = f"Directory not found: {self.directory}"
             logger.error(f"{LOG_EMOJI_ERROR} {error_msg}")
-            raise FileNotFoundError(error_msg)
+            raise FileNotFoundError(error_msg) from e
 
-        if not self.directory.is_dir():
+        if not stat.S_ISDIR(directory_stats.st_mode):
             error_msg = f"Path is not a directory: {self.directory}"
             logger.error(f"{LOG_EMOJI_ERROR} {error_msg}")
             raise NotADirectoryError(error_msg)
 
-        # Find all .xlsx files
-        excel_files = list(self.directory.glob("*.xlsx"))
-
-        # Filter out temporary Excel files (starting with ~$)
-        excel_files = [
-            f for f in excel_files if not f.name.startswith("~$")
-        ]
-
-        # Sort by modification time, newest first
-        excel_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-
-        logger.info(
-            f"{LOG_EMOJI_LOADING} Found {len(excel_files)} Excel "
-            f"files in {self.directory}"
+        # The directory mtime changes whenever files are added or
+        # removed, so it invalidates the cached listing. The integer
+        # nanosecond value avoids float rounding in the cache key.
+        return _scan_excel_files(
+            str(self.directory), directory_stats.st_mtime_ns
         )
-        return excel_files
 
     def get_file_modified_time(self, filepath: Path) -> datetime:
         """
@@ -96,12 +479,15 @@ class FileScanner:
         Raises:
             FileNotFoundError: If file does not exist
         """
-        if not filepath.exists():
+        # One stat call; a missing file surfaces as FileNotFoundError
+        # instead of being probed with a separate exists() check
+        try:
+            mtime = os.stat(filepath).st_mtime
+        except FileNotFoundError:
             error_msg = f"File not found: {filepath}"
             logger.error(f"{LOG_EMOJI_ERROR} {error_msg}")
-            raise FileNotFoundError(error_msg)
+            raise FileNotFoundError(error_msg) from None
 
-        mtime = filepath.stat().st_mtime
         modified_time = datetime.fromtimestamp(mtime)
 
         logger.debug(
@@ -109,6 +495,25 @@ class FileScanner:
         )
         return modified_time
 
+    def stat_once(self, filepath: Path) -> Optional[os.stat_result]:
+        """
+        Stat a file with a single system call.
+
+        Lets callers check existence and read the modification time
+        without separate file_exists and get_file_modified_time calls.
+
+        Args:
+            filepath: Path to file
+
+        Returns:
+            os.stat_result for the file, or None if it does not exist
+        """
+        try:
+            return os.stat(filepath)
+        except FileNotFoundError:
+            logger.debug(f"File not found during stat: {filepath}")
+            return None
+
     def file_exists(self, filepath: Path) -> bool:
         """
         Check if file exists.
@@ -119,7 +524,9 @@ class FileScanner:
         Returns:
             True if file exists and is a file, False otherwise
         """
-        exists = filepath.exists() and filepath.is_file()
+        # is_file() is already False for missing paths, so no separate
+        # exists() stat is needed
+        exists = filepath.is_file()
         logger.debug(f"File exists check for {filepath.name}: {exists}")
         return exists
 
@@ -148,18 +555,26 @@ class ExcelLoader:
             f"required columns: {self.required_columns}"
         )
 
-    @st.cache_data(ttl=300, show_spinner=False)
-    def load_file(_self, filepath: Path, file_mtime: float) -> pd.DataFrame:
+    def load_file(self, filepath: Path, file_mtime: float) -> pd.DataFrame:
         """
         Load Excel file and return DataFrame with caching.
 
-        This method uses Streamlit's caching mechanism to avoid
-        reloading the same file multiple times. Cache is based on
-        filepath and modification time, ensuring fresh data when
-        files are updated.
+        This method delegates to a module-level Streamlit cached loader
+        to avoid reloading the same file multiple times. Cache is based
+        on filepath, modification time and required columns, ensuring
+        fresh data when files are updated.
 
         Optimizations:
+        - Cache key is built from primitive arguments only, so no
+          instance state is hashed
+        - Parses with the calamine engine when python-calamine is
+          installed, falling back to openpyxl
+        - Reads only LOADED_COLUMNS and the required columns
         - Converts numeric columns early for better performance
+        - Reuses a Parquet sidecar
+          (<name>.<columns digest>.<mtime_ns>-<size>.parquet) written
+          for exactly this version of the workbook instead of
+          re-parsing it
         - Uses efficient pandas operations
 
         Args:
@@ -180,63 +595,34 @@ class ExcelLoader:
             - 10.3: Optimize data processing
             - 10.5: Use efficient pandas operations
         """
-        if not filepath.exists():
-            error_msg = f"File not found: {filepath}"
-            logger.error(f"{LOG_EMOJI_ERROR} {error_msg}")
-            raise FileNotFoundError(error_msg)
-
-        try:
-            logger.info(
-                f"{LOG_EMOJI_LOADING} Loading Excel file: "
-                f"{filepath.name} (mtime: {file_mtime})"
-            )
-
-            # Read Excel file from specific sheet
-            df = pd.read_excel(filepath, sheet_name=SHEET_NAME)
-
-            # Check if DataFrame is empty
-            if df.empty:
-                error_msg = f"Excel file sheet '{SHEET_NAME}' is empty: {filepath.name}"
-                logger.error(f"{LOG_EMOJI_ERROR} {error_msg}")
-                raise ValueError(error_msg)
-
-            # Optimize data types early for better performance
-            # Convert numeric columns to appropriate types
-            numeric_columns = [
-                'Sales_Amount',
-                'Sales_Qty',
-                'Net_Amount',
-                'Net_Qty'
-            ]
-
-            for col in numeric_columns:
-                if col in df.columns:
-                    df[col] = pd.to_numeric(
-                        df[col],
-                        errors='coerce',
-                        downcast='float'
-                    )
-                    logger.debug(
-                        f"Converted column '{col}' to numeric type"
-                    )
+        return _load_excel_cached(
+            str(filepath), file_mtime, tuple(self.required_columns)
+        )
 
-            logger.info(
-                f"{LOG_EMOJI_LOADING} Loaded and optimized {len(df)} "
-                f"rows from {filepath.name}"
-            )
-            return df
+    def prefetch_file(self, filepath: Path, file_mtime: float) -> None:
+        """
+        Load an Excel file into the cache on a background thread.
 
-        except pd.errors.EmptyDataError as e:
-            error_msg = f"Excel file contains no data: {filepath.name}"
-            logger.error(f"{LOG_EMOJI_ERROR} {error_msg}")
-            raise ValueError(error_msg) from e
+        Overlaps parsing with user think-time so that a later
+        load_file call for the same file returns from the cache.
+        The load runs without a ScriptRunContext, which the global
+        load cache does not need. Errors are logged and otherwise
+        ignored.
 
-        except Exception as e:
-            error_msg = (
-                f"Failed to read Excel file {filepath.name}: {str(e)}"
-            )
-            logger.error(f"{LOG_EMOJI_ERROR} {error_msg}")
-            raise ValueError(error_msg) from e
+        Args:
+            filepath: Path to Excel file
+            file_mtime: File modification time (used for cache key)
+        """
+        logger.info(
+            f"{LOG_EMOJI_LOADING} Prefetching Excel file: {filepath.name}"
+        )
+        future = _prefetch_executor.submit(
+            _load_excel_cached,
+            str(filepath),
+            file_mtime,
+            tuple(self.required_columns)
+        )
+        future.add_done_callback(_log_prefetch_failure)
 
     def validate_columns(
         self, df: pd.DataFrame
@@ -252,11 +638,10 @@ class ExcelLoader:
                 - is_valid: True if all required columns exist
                 - missing_columns: List of column names that are missing
         """
-        df_columns = set(df.columns)
-        required_set = set(self.required_columns)
-
-        missing_columns = list(required_set - df_columns)
-        is_valid = len(missing_columns) == 0
+        missing_columns = (
+            pd.Index(self.required_columns).difference(df.columns).tolist()
+        )
+        is_valid = not missing_columns
 
         if not is_valid:
             logger.warning(
@@ -276,7 +661,11 @@ class ExcelLoader:
         weekday_column: str = "Weekday"
     ) -> pd.DataFrame:
         """
-        Add weekday name column from date column.
+        Add weekday column from date column.
+
+        Weekdays are stored as int8 codes (0=Monday through 6=Sunday,
+        -1 for missing dates) indexing into WEEKDAY_ORDER.
+        MetricsCalculator.aggregate_by_weekday translates them to names.
 
         Args:
             df: pandas DataFrame containing date data
@@ -285,7 +674,7 @@ class ExcelLoader:
                 (default: "Weekday")
 
         Returns:
-            DataFrame with added weekday column
+            DataFrame with added weekday code column
 
         Raises:
             ValueError: If date_column does not exist in DataFrame
@@ -301,8 +690,11 @@ class ExcelLoader:
             # Convert to datetime if not already
             df[date_column] = pd.to_datetime(df[date_column])
 
-            # Extract weekday name
-            df[weekday_column] = df[date_column].dt.day_name()
+            # Store the weekday as an int8 code (0=Monday, -1 for
+            # missing dates); names are only materialized at display time
+            df[weekday_column] = (
+                df[date_column].dt.dayofweek.fillna(-1).astype("int8")
+            )
 
             logger.info(
                 f"{LOG_EMOJI_LOADING} Added weekday column "
@@ -6,7 +6,9 @@ sales metrics, aggregations, and top product rankings.
 """
 
 import logging
+from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 from .config import (
@@ -18,6 +20,8 @@ from .config import (
 
 logger = logging.getLogger(__name__)
 
+_WEEKDAY_DTYPE = pd.CategoricalDtype(categories=WEEKDAY_ORDER, ordered=True)
+
 
 class MetricsCalculator:
     """
@@ -46,6 +50,10 @@ class MetricsCalculator:
         """
         # Use copy to avoid modifying original DataFrame
         self.df = df.copy()
+
+        # Scalar totals are computed once and reused across renders
+        self._total_revenue: Optional[float] = None
+        self._total_units: Optional[int] = None
         logger.info(
             f"{LOG_EMOJI_PROCESSING} MetricsCalculator initialized "
             f"with {len(self.df)} rows"
@@ -60,22 +68,28 @@ class MetricsCalculator:
         Returns:
             Total revenue as float. Returns 0.0 if column missing or empty.
         """
-        if 'Transaction_Total' not in self.df.columns:
+        if self._total_revenue is not None:
+            return self._total_revenue
+
+        column = self.df.get('Transaction_Total')
+        if column is None:
             logger.warning(
                 f"{LOG_EMOJI_ERROR} Transaction_Total column not found"
             )
             return 0.0
 
-        total = self.df['Transaction_Total'].sum()
-
-        # Handle NaN result
-        if pd.isna(total):
-            total = 0.0
+        # Reduce the underlying ndarray directly; nansum skips NaN
+        # values and returns 0.0 for an empty or all-NaN column. The
+        # float64 accumulator avoids precision loss on float32 columns.
+        total = float(
+            np.nansum(column.to_numpy(copy=False), dtype=np.float64)
+        )
 
         logger.info(
             f"{LOG_EMOJI_PROCESSING} Calculated total revenue: ${total:,.2f}"
         )
-        return float(total)
+        self._total_revenue = total
+        return total
 
     def calculate_total_units(self) -> int:
         """
@@ -86,22 +100,29 @@ class MetricsCalculator:
         Returns:
             Total units as integer. Returns 0 if column missing or empty.
         """
-        if 'Sales_Qty' not in self.df.columns:
+        if self._total_units is not None:
+            return self._total_units
+
+        column = self.df.get('Sales_Qty')
+        if column is None:
             logger.warning(
                 f"{LOG_EMOJI_ERROR} Sales_Qty column not found"
             )
             return 0
 
-        total = self.df['Sales_Qty'].sum()
-
-        # Handle NaN result
-        if pd.isna(total):
-            total = 0
+        # Reduce the underlying ndarray directly; nansum skips NaN
+        # values and returns 0 for an empty or all-NaN column. Summing
+        # in float64 keeps fractional quantities until the final
+        # truncation, which an int64 accumulator would drop per row.
+        total = int(
+            np.nansum(column.to_numpy(copy=False), dtype=np.float64)
+        )
 
         logger.info(
-            f"{LOG_EMOJI_PROCESSING} Calculated total units: {int(total):,}"
+            f"{LOG_EMOJI_PROCESSING} Calculated total units: {total:,}"
         )
-        return int(total)
+        self._total_units = total
+        return total
 
     def get_top_products_by_revenue(
         self,
@@ -135,13 +156,12 @@ class MetricsCalculator:
             )
             return pd.DataFrame(columns=[product_column, 'Sales_Amount'])
 
-        # Aggregate by product and sum revenue
+        # Aggregate by product and select top N with a partial sort
         product_revenue = (
             self.df.groupby(product_column)['Sales_Amount']
             .sum()
             .reset_index()
-            .sort_values('Sales_Amount', ascending=False)
-            .head(top_n)
+            .nlargest(top_n, 'Sales_Amount')
             .reset_index(drop=True)
         )
 
@@ -183,13 +203,12 @@ class MetricsCalculator:
             )
             return pd.DataFrame(columns=[product_column, 'Sales_Qty'])
 
-        # Aggregate by product and sum units
+        # Aggregate by product and select top N with a partial sort
         product_units = (
             self.df.groupby(product_column)['Sales_Qty']
             .sum()
             .reset_index()
-            .sort_values('Sales_Qty', ascending=False)
-            .head(top_n)
+            .nlargest(top_n, 'Sales_Qty')
             .reset_index(drop=True)
         )
 
@@ -212,7 +231,8 @@ class MetricsCalculator:
 
         Args:
             value_column: Name of column to aggregate (e.g., 'Sales_Amount')
-            weekday_column: Name of weekday column (default: 'Weekday')
+            weekday_column: Name of weekday column holding int8 codes
+                from ExcelLoader or weekday names (default: 'Weekday')
 
         Returns:
             DataFrame with columns [weekday_column, value_column]
@@ -233,24 +253,25 @@ class MetricsCalculator:
             )
             return pd.DataFrame(columns=[weekday_column, value_column])
 
-        # Aggregate by weekday
-        weekday_agg = (
-            self.df.groupby(weekday_column)[value_column]
-            .sum()
-            .reset_index()
-        )
-
-        # Create categorical type with proper ordering
-        weekday_agg[weekday_column] = pd.Categorical(
-            weekday_agg[weekday_column],
-            categories=WEEKDAY_ORDER,
-            ordered=True
-        )
+        # ExcelLoader provides int8 weekday codes (0=Monday); weekday
+        # names are converted to the same codes before grouping
+        weekday_codes = self.df[weekday_column]
+        if not pd.api.types.is_integer_dtype(weekday_codes.dtype):
+            weekday_codes = weekday_codes.astype(_WEEKDAY_DTYPE).cat.codes
 
-        # Sort by weekday order
-        weekday_agg = weekday_agg.sort_values(weekday_column).reset_index(
-            drop=True
+        # Aggregate by weekday code; sorted codes are Monday-Sunday
+        weekday_sums = (
+            self.df[value_column].groupby(weekday_codes, sort=True).sum()
         )
+        weekday_sums = weekday_sums[weekday_sums.index >= 0]
+
+        # Translate the (at most seven) codes back to weekday names
+        weekday_agg = pd.DataFrame({
+            weekday_column: pd.Categorical.from_codes(
+                weekday_sums.index, dtype=_WEEKDAY_DTYPE
+            ),
+            value_column: weekday_sums.to_numpy(),
+        })
 
         logger.info(
             f"{LOG_EMOJI_PROCESSING} Aggregated {value_column} by weekday"
@@ -6,6 +6,9 @@ total revenue, total units, and top products displays.
 """
 
 import logging
+import threading
+from types import ModuleType
+from typing import Any, Dict, Optional
 
 import pandas as pd
 import streamlit as st
@@ -17,6 +20,106 @@ from .utils import format_currency, format_units
 
 logger = logging.getLogger(__name__)
 
+# plotly.express is imported on first chart render to keep it out of
+# dashboard cold start
+_plotly_express: Optional[ModuleType] = None
+
+
+def _px() -> ModuleType:
+    """
+    Return the plotly.express module, importing it on first use.
+
+    Returns:
+        The plotly.express module
+    """
+    global _plotly_express
+    if _plotly_express is None:
+        import plotly.express as plotly_express
+
+        _plotly_express = plotly_express
+    return _plotly_express
+
+
+# Cached bar figures are shared between sessions; the lock keeps one
+# render's data from leaking into another while it is serialized
+_bar_figure_lock = threading.Lock()
+
+
+@st.cache_resource(show_spinner=False)
+def _base_bar_figure(
+    x_column: str,
+    y_column: str,
+    x_title: str,
+    texttemplate: str,
+    color: str
+) -> Any:
+    """
+    Build a reusable horizontal bar figure skeleton.
+
+    The layout and trace styling are created once; each render only
+    replaces the trace data.
+
+    Args:
+        x_column: Name of value column (used for hover labels)
+        y_column: Name of category column (used for hover labels)
+        x_title: X-axis title
+        texttemplate: Plotly text template for bar labels
+        color: Bar color
+
+    Returns:
+        Plotly Figure with a single horizontal bar trace
+    """
+    fig = _px().bar(
+        x=[0],
+        y=[""],
+        orientation='h',
+        text=[0],
+        labels={'x': x_column, 'y': y_column},
+        color_discrete_sequence=[color]
+    )
+
+    fig.update_traces(
+        texttemplate=texttemplate,
+        textposition='outside'
+    )
+
+    fig.update_layout(
+        xaxis_title=x_title,
+        yaxis_title="",
+        showlegend=False,
+        height=300,
+        margin=dict(l=0, r=0, t=0, b=0)
+    )
+    return fig
+
+
+def _plot_bar_chart(
+    chart_config: Dict[str, Any],
+    x_title: str,
+    texttemplate: str
+) -> None:
+    """
+    Render a horizontal bar chart from a chart configuration.
+
+    Args:
+        chart_config: Configuration from ChartGenerator.create_bar_chart
+        x_title: X-axis title
+        texttemplate: Plotly text template for bar labels
+    """
+    x_column = chart_config['x_column']
+    y_column = chart_config['y_column']
+    fig = _base_bar_figure(
+        x_column, y_column, x_title, texttemplate, chart_config['color']
+    )
+
+    values = chart_config['data'][x_column].to_numpy()
+    with _bar_figure_lock:
+        trace = fig.data[0]
+        trace.x = values
+        trace.y = chart_config['data'][y_column].to_numpy()
+        trace.text = values
+        st.plotly_chart(fig, use_container_width=True)
+
 
 def render_metrics_section(
     calculator: MetricsCalculator,
@@ -125,35 +228,13 @@ def _render_revenue_chart(data: pd.DataFrame) -> None:
             orientation='h'
         )
 
-        # Render using Plotly
-        import plotly.express as px
-
-        fig = px.bar(
-            chart_config['data'],
-            x=chart_config['x_column'],
-            y=chart_config['y_column'],
-            orientation=chart_config['orientation'],
-            text=chart_config['x_column'],
-            color_discrete_sequence=[chart_config['color']]
-        )
-
-        # Format text labels as currency
-        fig.update_traces(
-            texttemplate='$%{text:,.2f}',
-            textposition='outside'
+        # Render using Plotly, formatting text labels as currency
+        _plot_bar_chart(
+            chart_config,
+            x_title="Revenue ($)",
+            texttemplate='$%{text:,.2f}'
         )
 
-        # Update layout
-        fig.update_layout(
-            xaxis_title="Revenue ($)",
-            yaxis_title="",
-            showlegend=False,
-            height=300,
-            margin=dict(l=0, r=0, t=0, b=0)
-        )
-
-        st.plotly_chart(fig, use_container_width=True)
-
         logger.info(
             f"{LOG_EMOJI_PROCESSING} Rendered revenue chart "
             f"with {len(data)} products"
@@ -188,35 +269,14 @@ def _render_units_chart(data: pd.DataFrame) -> None:
             orientation='h'
         )
 
-        # Render using Plotly
-        import plotly.express as px
-
-        fig = px.bar(
-            chart_config['data'],
-            x=chart_config['x_column'],
-            y=chart_config['y_column'],
-            orientation=chart_config['orientation'],
-            text=chart_config['x_column'],
-            color_discrete_sequence=[chart_config['color']]
+        # Render using Plotly, formatting text labels as integers
+        # with commas
+        _plot_bar_chart(
+            chart_config,
+            x_title="Units Sold",
+            texttemplate='%{text:,.0f}'
         )
 
-        # Format text labels as integers with commas
-        fig.update_traces(
-            texttemplate='%{text:,.0f}',
-            textposition='outside'
-        )
-
-        # Update layout
-        fig.update_layout(
-            xaxis_title="Units Sold",
-            yaxis_title="",
-            showlegend=False,
-            height=300,
-            margin=dict(l=0, r=0, t=0, b=0)
-        )
-
-        st.plotly_chart(fig, use_container_width=True)
-
         logger.info(
             f"{LOG_EMOJI_PROCESSING} Rendered units chart "
             f"with {len(data)} products"
@@ -5,17 +5,62 @@ This module provides the sidebar rendering functionality including
 file selection, refresh controls, and status display.
 """
 
-import logging
+import functools
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
 import streamlit as st
 
-from .config import LOG_EMOJI_LOADING, LOG_EMOJI_SUCCESS, LOG_EMOJI_WARNING
-from .utils import format_datetime
+from .config import (
+    DATE_FORMAT,
+    LOG_EMOJI_LOADING,
+    LOG_EMOJI_SUCCESS,
+    LOG_EMOJI_WARNING,
+)
+from .data_loader import FileInfo
+from .utils import format_datetime, get_dashboard_logger
 
-logger = logging.getLogger(__name__)
+logger = get_dashboard_logger(__name__)
+
+# Byte multiples for file size display
+_KB = 1024
+_MB = 1024 * 1024
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _stat_cached(path_str: str) -> os.stat_result:
+    """
+    Stat a file, caching the result briefly across reruns.
+
+    Args:
+        path_str: Path to file
+
+    Returns:
+        os.stat_result for the file
+
+    Raises:
+        FileNotFoundError: If file does not exist
+    """
+    return os.stat(path_str)
+
+
+@functools.lru_cache(maxsize=256)
+def _mtime_to_str(mtime: float) -> str:
+    """
+    Convert a file modification time to a display string.
+
+    Modification times rarely change between reruns, so the
+    localtime conversion and formatting run once per distinct value.
+
+    Args:
+        mtime: Modification time in seconds since the epoch
+
+    Returns:
+        Timestamp formatted with DATE_FORMAT
+    """
+    return datetime.fromtimestamp(mtime).strftime(DATE_FORMAT)
 
 
 def render_sidebar(
@@ -55,44 +100,97 @@ def render_sidebar(
         - 7.4: Show current filename
         - 8.1-8.5: Sidebar organization and labels
     """
+    # Fragments cannot call st.sidebar themselves, so the sidebar
+    # context wraps the fragment call
     with st.sidebar:
-        # Dashboard title at top of sidebar
-        st.title("📊 Sales Analytics Dashboard")
-        st.divider()
-        
-        st.header("📁 Data Selection")
-
-        # File selector dropdown
-        selected_file = _render_file_selector(available_files, current_file)
-
-        st.divider()
-
-        # Refresh button
-        st.header("🔄 Controls")
-        refresh_clicked = st.button(
-            "Refresh Data",
-            use_container_width=True,
-            type="primary",
-            help="Reload the currently selected file"
+        _render_sidebar_fragment(
+            available_files, current_file, last_update, success_message
         )
 
-        st.divider()
+    selected_file = st.session_state.get("selected_file")
+    refresh_clicked = st.session_state.pop("refresh_requested", False)
 
-        # Status section
-        st.header("ℹ️ Status")
-        
-        # Display success message if provided
-        if success_message:
-            st.success(success_message)
-        
-        _render_status_section(current_file, last_update)
+    # Lazy %-style args: nothing is formatted unless DEBUG is enabled
+    logger.debug(
+        "%s Sidebar rendered - Selected: %s, Refresh: %s",
+        LOG_EMOJI_LOADING, selected_file, refresh_clicked
+    )
 
-        logger.debug(
-            f"{LOG_EMOJI_LOADING} Sidebar rendered - "
-            f"Selected: {selected_file}, Refresh: {refresh_clicked}"
-        )
+    return selected_file, refresh_clicked
+
+
+def _mark_sidebar_interaction() -> None:
+    """Record that the user changed a sidebar widget (widget callback)."""
+    st.session_state["sidebar_interaction"] = True
+
+
+def _request_refresh() -> None:
+    """Record a Refresh Data click until the page consumes it."""
+    st.session_state["refresh_requested"] = True
+    _mark_sidebar_interaction()
+
+
+@st.fragment
+def _render_sidebar_fragment(
+    available_files: List[Path],
+    current_file: Optional[Path],
+    last_update: Optional[datetime],
+    success_message: Optional[str]
+) -> None:
+    """
+    Render sidebar widgets as a fragment that reruns on its own.
+
+    Widget interactions rerun only this fragment. The whole app is
+    rerun only when the page has to react, i.e. when a different file
+    is selected or a refresh is requested. Results are published to
+    st.session_state ("selected_file", "refresh_requested").
+
+    Args:
+        available_files: List of available Excel files to select from
+        current_file: File loaded by the page at the last full run
+        last_update: Timestamp of last data update (if any)
+        success_message: Success message to display (if any)
+    """
+    # Dashboard title at top of sidebar
+    st.title("📊 Sales Analytics Dashboard")
+    st.divider()
+
+    st.header("📁 Data Selection")
+
+    # File selector dropdown
+    selected_file = _render_file_selector(available_files, current_file)
+    st.session_state["selected_file"] = selected_file
+
+    st.divider()
+
+    # Refresh button
+    st.header("🔄 Controls")
+    st.button(
+        "Refresh Data",
+        use_container_width=True,
+        type="primary",
+        help="Reload the currently selected file",
+        on_click=_request_refresh
+    )
+
+    st.divider()
+
+    # Status section
+    st.header("ℹ️ Status")
 
-        return selected_file, refresh_clicked
+    # Display success message if provided
+    if success_message:
+        st.success(success_message)
+
+    _render_status_section(current_file, last_update)
+
+    # Callbacks only fire on user interaction, so full runs never
+    # trigger another rerun here
+    if st.session_state.pop("sidebar_interaction", False) and (
+        st.session_state.get("refresh_requested", False)
+        or selected_file != current_file
+    ):
+        st.rerun(scope="app")
 
 
 def _render_file_selector(
@@ -117,30 +215,34 @@ def _render_file_selector(
         )
         return None
 
-    # Create display names (filename only)
-    file_names = [f.name for f in available_files]
+    # Map display names (filename only) to paths in a single pass;
+    # the dict keeps display order and gives O(1) lookups. Building it
+    # directly is cheaper than hashing the file list for st.cache_data.
+    name_to_path: Dict[str, Path] = {f.name: f for f in available_files}
+    file_names = list(name_to_path)
+
+    # Determine default index from the filename remembered in session
+    # state, falling back to the current file's name
+    default_name = st.session_state.get("selected_filename")
+    if default_name is None and current_file is not None:
+        default_name = current_file.name
 
-    # Determine default index
     default_index = 0
-    if current_file and current_file in available_files:
-        default_index = available_files.index(current_file)
+    if default_name in name_to_path:
+        default_index = file_names.index(default_name)
 
     # Render selectbox
     selected_name = st.selectbox(
         "Select Data File",
         options=file_names,
         index=default_index,
-        help="Choose an Excel file to analyze"
+        help="Choose an Excel file to analyze",
+        on_change=_mark_sidebar_interaction
     )
 
-    # Find corresponding Path object
-    selected_file = None
-    for file_path in available_files:
-        if file_path.name == selected_name:
-            selected_file = file_path
-            break
-
-    return selected_file
+    # Remember the selection by name and derive the Path on demand
+    st.session_state["selected_filename"] = selected_name
+    return name_to_path.get(selected_name)
 
 
 def _render_status_section(
@@ -159,15 +261,15 @@ def _render_status_section(
         formatted_time = format_datetime(last_update)
         st.caption(f"Latest Update: {formatted_time}")
         logger.debug(
-            f"{LOG_EMOJI_SUCCESS} Status displayed - "
-            f"Last update: {last_update}"
+            "%s Status displayed - Last update: %s",
+            LOG_EMOJI_SUCCESS, last_update
         )
     else:
         st.caption("No data loaded yet")
 
 
 def render_file_metadata(
-    filepath: Path,
+    filepath: Union[Path, FileInfo],
     show_size: bool = True,
     show_modified: bool = True
 ) -> None:
@@ -175,10 +277,15 @@ def render_file_metadata(
     Render file metadata information.
 
     This function displays file size and last modified time
-    for the given file path.
+    for the given file. Passing a FileInfo from
+    FileScanner.list_excel_file_info renders without any stat call.
+
+    The details sit behind a "Show details" toggle that is off by
+    default; while it is off no stat call or metric rendering is done.
+    The toggle state persists in st.session_state["file_info_open"].
 
     Args:
-        filepath: Path to file
+        filepath: Path to file, or FileInfo with precomputed metadata
         show_size: Whether to display file size (default: True)
         show_modified: Whether to display last modified time (default: True)
 
@@ -186,39 +293,41 @@ def render_file_metadata(
         - 7.5: Show file metadata
         - 9.3: Display file information
     """
-    if not filepath.exists():
-        st.warning(f"File not found: {filepath.name}")
-        return
-
     st.subheader("📄 File Information")
 
-    # Get file stats
-    file_stats = filepath.stat()
+    # Skip the stat and metric rendering while the details are hidden
+    if not st.toggle("Show details", key="file_info_open"):
+        return
 
-    # Display file size
-    if show_size:
+    if isinstance(filepath, FileInfo):
+        size_bytes = filepath.size
+        mtime = filepath.mtime
+    else:
+        # A single cached stat replaces the exists() + stat() pair
+        try:
+            file_stats = _stat_cached(str(filepath))
+        except FileNotFoundError:
+            st.warning(f"File not found: {filepath.name}")
+            return
         size_bytes = file_stats.st_size
-        size_mb = size_bytes / (1024 * 1024)
+        mtime = file_stats.st_mtime
 
-        if size_mb < 1:
-            size_kb = size_bytes / 1024
-            size_str = f"{size_kb:.2f} KB"
+    # Display file size
+    if show_size:
+        # Integer compare picks the unit, then a single division
+        if size_bytes < _MB:
+            size_str = f"{size_bytes / _KB:.2f} KB"
         else:
-            size_str = f"{size_mb:.2f} MB"
+            size_str = f"{size_bytes / _MB:.2f} MB"
 
         st.metric(label="File Size", value=size_str)
 
     # Display last modified time
     if show_modified:
-        modified_timestamp = datetime.fromtimestamp(file_stats.st_mtime)
-        st.metric(
-            label="Last Modified",
-            value=format_datetime(modified_timestamp)
-        )
+        st.metric(label="Last Modified", value=_mtime_to_str(mtime))
 
     logger.debug(
-        f"{LOG_EMOJI_LOADING} File metadata displayed for "
-        f"{filepath.name}"
+        "%s File metadata displayed for %s", LOG_EMOJI_LOADING, filepath
     )
 
 
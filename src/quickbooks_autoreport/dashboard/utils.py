@@ -5,9 +5,14 @@ This module provides formatting utilities for currency, numbers, dates,
 error messages, and logging setup with emoji indicators.
 """
 
+import functools
 import logging
+import sys
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Dict, Optional
+
+import pandas as pd
+import streamlit as st
 
 from .config import (
     CURRENCY_SYMBOL,
@@ -24,6 +29,10 @@ from .config import (
 # Currency and Number Formatting
 # ============================================================================
 
+# Bound str.format methods reuse their parsed format spec on every call
+_INT_FORMAT: Callable[[int], str] = "{:,}".format
+_FLOAT_FORMATS: Dict[int, Callable[[float], str]] = {}
+
 
 def format_currency(value: float, symbol: str = CURRENCY_SYMBOL) -> str:
     """
@@ -63,8 +72,38 @@ def format_number(value: float, decimals: int = 0) -> str:
         '1,234.57'
     """
     if decimals == 0:
-        return f"{int(value):,}"
-    return f"{value:,.{decimals}f}"
+        return _INT_FORMAT(int(value))
+
+    formatter = _FLOAT_FORMATS.get(decimals)
+    if formatter is None:
+        formatter = _FLOAT_FORMATS.setdefault(
+            decimals, ("{:,." + str(decimals) + "f}").format
+        )
+    return formatter(value)
+
+
+def format_number_series(values: pd.Series) -> pd.Series:
+    """
+    Format a Series of numbers as whole numbers with thousand separators.
+
+    Vectorized counterpart of format_number(value, decimals=0); missing
+    values (NaN/NA/None) are left as they are instead of raising.
+
+    Args:
+        values: Numeric Series to format
+
+    Returns:
+        Series of formatted strings (e.g., "1,234"), with missing
+        values kept in place
+
+    Examples:
+        >>> format_number_series(pd.Series([1234, 1000000])).tolist()
+        ['1,234', '1,000,000']
+    """
+    present = values.notna()
+    formatted = values.astype(object)
+    formatted[present] = values[present].astype("int64").map(_INT_FORMAT)
+    return formatted
 
 
 def format_units(value: float) -> str:
@@ -91,6 +130,24 @@ def format_units(value: float) -> str:
 # ============================================================================
 
 
+@functools.lru_cache(maxsize=1024)
+def _format_datetime_cached(dt: datetime, fmt: str) -> str:
+    """
+    Format a datetime, memoizing results for repeated values.
+
+    Sidebar reruns format the same timestamps over and over, so the
+    strftime work is done once per distinct (datetime, format) pair.
+
+    Args:
+        dt: The datetime object to format
+        fmt: Format string
+
+    Returns:
+        Formatted datetime string
+    """
+    return dt.strftime(fmt)
+
+
 def format_datetime(dt: datetime, fmt: str = DATE_FORMAT) -> str:
     """
     Format a datetime object as a string.
@@ -107,7 +164,7 @@ def format_datetime(dt: datetime, fmt: str = DATE_FORMAT) -> str:
         >>> format_datetime(dt)
         '2025-10-08 17:00:04'
     """
-    return dt.strftime(fmt)
+    return _format_datetime_cached(dt, fmt)
 
 
 def format_timestamp(timestamp: Optional[datetime] = None) -> str:
@@ -146,9 +203,8 @@ def format_date_range(start_date: datetime, end_date: datetime) -> str:
         >>> format_date_range(start, end)
         '2025-10-01 to 2025-10-07'
     """
-    start_str = start_date.strftime("%Y-%m-%d")
-    end_str = end_date.strftime("%Y-%m-%d")
-    return f"{start_str} to {end_str}"
+    # isoformat() starts with YYYY-MM-DD; slicing it skips strftime
+    return f"{start_date.isoformat()[:10]} to {end_date.isoformat()[:10]}"
 
 
 # ============================================================================
@@ -239,6 +295,19 @@ def format_empty_directory_message(directory: str) -> str:
 # Logging Setup
 # ============================================================================
 
+# Emoji prefixes are built once; the log helpers defer joining them
+# with the message until a record is actually emitted
+LOG_PREFIX_LOADING: str = sys.intern(f"{LOG_EMOJI_LOADING} ")
+LOG_PREFIX_PROCESSING: str = sys.intern(f"{LOG_EMOJI_PROCESSING} ")
+LOG_PREFIX_SUCCESS: str = sys.intern(f"{LOG_EMOJI_SUCCESS} ")
+LOG_PREFIX_ERROR: str = sys.intern(f"{LOG_EMOJI_ERROR} ")
+LOG_PREFIX_WARNING: str = sys.intern(f"{LOG_EMOJI_WARNING} ")
+
+# Shared formatter for loggers configured with the default format
+_DEFAULT_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
 
 def setup_logger(
     name: str,
@@ -271,13 +340,11 @@ def setup_logger(
     handler = logging.StreamHandler()
     handler.setLevel(level)
 
-    # Create formatter
+    # Reuse the shared formatter unless a custom format is requested
     if format_string is None:
-        format_string = (
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
-
-    formatter = logging.Formatter(format_string)
+        formatter = _DEFAULT_FORMATTER
+    else:
+        formatter = logging.Formatter(format_string)
     handler.setFormatter(formatter)
 
     # Add handler to logger
@@ -286,6 +353,26 @@ def setup_logger(
     return logger
 
 
+@st.cache_resource(show_spinner=False)
+def get_dashboard_logger(name: str) -> logging.Logger:
+    """
+    Return a dashboard logger configured once per process.
+
+    Streamlit reruns page scripts on every interaction; caching the
+    logger as a resource keeps setup_logger from running again.
+
+    Args:
+        name: Logger name (typically __name__)
+
+    Returns:
+        Configured logger instance
+
+    Examples:
+        >>> logger = get_dashboard_logger(__name__)  # doctest: +SKIP
+    """
+    return setup_logger(name)
+
+
 def log_loading(logger: logging.Logger, message: str) -> None:
     """
     Log a loading message with emoji indicator.
@@ -298,7 +385,7 @@ def log_loading(logger: logging.Logger, message: str) -> None:
         >>> logger = setup_logger(__name__)
         >>> log_loading(logger, "Loading file")  # doctest: +SKIP
     """
-    logger.info(f"{LOG_EMOJI_LOADING} {message}")
+    logger.info("%s%s", LOG_PREFIX_LOADING, message)
 
 
 def log_processing(logger: logging.Logger, message: str) -> None:
@@ -313,7 +400,7 @@ def log_processing(logger: logging.Logger, message: str) -> None:
         >>> logger = setup_logger(__name__)
         >>> log_processing(logger, "Calculating metrics...")  # doctest: +SKIP
     """
-    logger.info(f"{LOG_EMOJI_PROCESSING} {message}")
+    logger.info("%s%s", LOG_PREFIX_PROCESSING, message)
 
 
 def log_success(logger: logging.Logger, message: str) -> None:
@@ -328,7 +415,7 @@ def log_success(logger: logging.Logger, message: str) -> None:
         >>> logger = setup_logger(__name__)
         >>> log_success(logger, "Dashboard updated")  # doctest: +SKIP
     """
-    logger.info(f"{LOG_EMOJI_SUCCESS} {message}")
+    logger.info("%s%s", LOG_PREFIX_SUCCESS, message)
 
 
 def log_error(logger: logging.Logger, message: str) -> None:
@@ -343,7 +430,7 @@ def log_error(logger: logging.Logger, message: str) -> None:
         >>> logger = setup_logger(__name__)
         >>> log_error(logger, "Failed to load file")  # doctest: +SKIP
     """
-    logger.error(f"{LOG_EMOJI_ERROR} {message}")
+    logger.error("%s%s", LOG_PREFIX_ERROR, message)
 
 
 def log_warning(logger: logging.Logger, message: str) -> None:
@@ -358,4 +445,4 @@ def log_warning(logger: logging.Logger, message: str) -> None:
         >>> logger = setup_logger(__name__)
         >>> log_warning(logger, "File modification detected")  # doctest: +SKIP
     """
-    logger.warning(f"{LOG_EMOJI_WARNING} {message}")
+    logger.warning("%s%s", LOG_PREFIX_WARNING, message)
@@ -4,9 +4,11 @@ This module defines the DiagnosticResult dataclass for structured
 diagnostic information about the system and QuickBooks installation.
 """
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import List, Dict, Any
 
+_SUMMARY_HEADER = "=== QuickBooks Auto Reporter Diagnostics ==="
+
 
 @dataclass
 class DiagnosticResult:
@@ -37,7 +39,16 @@ class DiagnosticResult:
         Returns:
             Dictionary representation of diagnostic results
         """
-        return asdict(self)
+        # Shallow copies keep the result independent of this instance
+        # without the recursive deep copy done by dataclasses.asdict
+        return {
+            "timestamp": self.timestamp,
+            "system_info": dict(self.system_info),
+            "quickbooks_installation": dict(self.quickbooks_installation),
+            "sdk_installation": dict(self.sdk_installation),
+            "connectivity_test": dict(self.connectivity_test),
+            "recommendations": list(self.recommendations),
+        }
 
     def get_summary(self) -> str:
         """Get a human-readable summary of diagnostics.
@@ -45,44 +56,50 @@ class DiagnosticResult:
         Returns:
             Multi-line summary string
         """
-        lines = [
-            "=== QuickBooks Auto Reporter Diagnostics ===",
-            f"Timestamp: {self.timestamp}",
-            "",
-            "System Information:",
+        qb = self.quickbooks_installation
+        sdk = self.sdk_installation
+        conn = self.connectivity_test
+
+        # Each section is one coarse chunk; key/value blocks are built
+        # with a single join instead of an append per line
+        parts = [
+            f"{_SUMMARY_HEADER}\nTimestamp: {self.timestamp}\n\n"
+            "System Information:"
         ]
-        
-        for key, value in self.system_info.items():
-            lines.append(f"  {key}: {value}")
-        
-        lines.append("")
-        lines.append("QuickBooks Installation:")
-        qb_status = self.quickbooks_installation.get("status", "Unknown")
-        lines.append(f"  Status: {qb_status}")
-        if "version" in self.quickbooks_installation:
-            lines.append(f"  Version: {self.quickbooks_installation['version']}")
-        
-        lines.append("")
-        lines.append("SDK Installation:")
-        sdk_status = self.sdk_installation.get("status", "Unknown")
-        lines.append(f"  Status: {sdk_status}")
-        if "version" in self.sdk_installation:
-            lines.append(f"  Version: {self.sdk_installation['version']}")
-        
-        lines.append("")
-        lines.append("Connectivity Test:")
-        conn_status = self.connectivity_test.get("status", "Unknown")
-        lines.append(f"  Status: {conn_status}")
-        if "message" in self.connectivity_test:
-            lines.append(f"  Message: {self.connectivity_test['message']}")
-        
+        if self.system_info:
+            parts.append("\n".join(
+                f"  {key}: {value}" for key, value in self.system_info.items()
+            ))
+
+        parts.append(
+            f"\nQuickBooks Installation:\n"
+            f"  Status: {qb.get('status', 'Unknown')}"
+        )
+        if "version" in qb:
+            parts.append(f"  Version: {qb['version']}")
+
+        parts.append(
+            f"\nSDK Installation:\n"
+            f"  Status: {sdk.get('status', 'Unknown')}"
+        )
+        if "version" in sdk:
+            parts.append(f"  Version: {sdk['version']}")
+
+        parts.append(
+            f"\nConnectivity Test:\n"
+            f"  Status: {conn.get('status', 'Unknown')}"
+        )
+        if "message" in conn:
+            parts.append(f"  Message: {conn['message']}")
+
         if self.recommendations:
-            lines.append("")
-            lines.append("Recommendations:")
-            for i, rec in enumerate(self.recommendations, 1):
-                lines.append(f"  {i}. {rec}")
-        
-        return "\n".join(lines)
+            parts.append("\nRecommendations:")
+            parts.append("\n".join(
+                f"  {i}. {rec}"
+                for i, rec in enumerate(self.recommendations, 1)
+            ))
+
+        return "\n".join(parts)
 
     def has_issues(self) -> bool:
         """Check if diagnostics found any issues.
@@ -4,10 +4,57 @@ This module defines the ReportConfig dataclass that replaces dict-based
 report configurations with a strongly-typed, immutable model.
 """
 
+import functools
 import os
 from dataclasses import dataclass
 from typing import Dict
 
+# (attribute, label) pairs checked by ReportConfig.validate before and
+# after the query_type check, keeping the order errors are reported in
+_REQUIRED_FIELDS_BEFORE_QUERY_TYPE = (
+    ("key", "Report key"),
+    ("name", "Report name"),
+    ("qbxml_type", "qbXML type"),
+)
+_REQUIRED_FIELDS_AFTER_QUERY_TYPE = (
+    ("csv_filename", "CSV filename"),
+    ("excel_filename", "Excel filename"),
+)
+_VALID_QUERY_TYPES = frozenset({"GeneralDetail", "GeneralSummary", "Aging"})
+
+
+@functools.lru_cache(maxsize=128)
+def _build_file_paths(
+    output_dir: str,
+    csv_filename: str,
+    excel_filename: str,
+    hash_filename: str,
+    request_log: str,
+    response_log: str,
+) -> Dict[str, str]:
+    """Join report filenames onto an output directory (memoized).
+
+    Args:
+        output_dir: Base output directory path
+        csv_filename: Output CSV filename
+        excel_filename: Output Excel filename
+        hash_filename: Hash file for change detection
+        request_log: XML request log filename
+        response_log: XML response log filename
+
+    Returns:
+        Dictionary of file paths keyed as in ReportConfig.get_file_paths
+    """
+    join = os.path.join
+    return {
+        "main_csv": join(output_dir, csv_filename),
+        "excel_file": join(output_dir, excel_filename),
+        "hash_file": join(output_dir, hash_filename),
+        "log_file": join(output_dir, "QuickBooks_Auto_Reports.log"),
+        "req_log": join(output_dir, request_log),
+        "resp_log": join(output_dir, response_log),
+    }
+
 
 @dataclass(frozen=True)
 class ReportConfig:
@@ -55,14 +102,16 @@ class ReportConfig:
                 - req_log: Path to XML request log
                 - resp_log: Path to XML response log
         """
-        return {
-            "main_csv": os.path.join(output_dir, self.csv_filename),
-            "excel_file": os.path.join(output_dir, self.excel_filename),
-            "hash_file": os.path.join(output_dir, self.hash_filename),
-            "log_file": os.path.join(output_dir, "QuickBooks_Auto_Reports.log"),
-            "req_log": os.path.join(output_dir, self.request_log),
-            "resp_log": os.path.join(output_dir, self.response_log),
-        }
+        # The config is frozen, so the joined paths are memoized; a copy
+        # is returned so callers cannot mutate the cached dict
+        return dict(_build_file_paths(
+            output_dir,
+            self.csv_filename,
+            self.excel_filename,
+            self.hash_filename,
+            self.request_log,
+            self.response_log,
+        ))
 
     def validate(self) -> None:
         """Validate report configuration.
@@ -70,18 +119,14 @@ class ReportConfig:
         Raises:
             ValueError: If any required field is empty or invalid
         """
-        if not self.key:
-            raise ValueError("Report key cannot be empty")
-        if not self.name:
-            raise ValueError("Report name cannot be empty")
-        if not self.qbxml_type:
-            raise ValueError("qbXML type cannot be empty")
-        if self.query_type not in ("GeneralDetail", "GeneralSummary", "Aging"):
+        for attr, label in _REQUIRED_FIELDS_BEFORE_QUERY_TYPE:
+            if not getattr(self, attr):
+                raise ValueError(f"{label} cannot be empty")
+        if self.query_type not in _VALID_QUERY_TYPES:
             raise ValueError(
                 f"Invalid query_type: {self.query_type}. "
                 "Must be GeneralDetail, GeneralSummary, or Aging"
             )
-        if not self.csv_filename:
-            raise ValueError("CSV filename cannot be empty")
-        if not self.excel_filename:
-            raise ValueError("Excel filename cannot be empty")
+        for attr, label in _REQUIRED_FIELDS_AFTER_QUERY_TYPE:
+            if not getattr(self, attr):
+                raise ValueError(f"{label} cannot be empty")
@@ -4,12 +4,19 @@ This module defines the ReportResult dataclass for structured return values
 from report generation operations.
 """
 
+import sys
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, Dict, Any
 
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep a
+# per-instance __dict__
+_DATACLASS_OPTIONS: Dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ReportResult:
     """Result of a report execution.
     
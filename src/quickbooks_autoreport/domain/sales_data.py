@@ -1,5 +1,6 @@
 """Domain models for sales dashboard data."""
 
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -13,6 +14,11 @@ if TYPE_CHECKING:
         FileScanner,
     )
 
+_NS_PER_SECOND = 1_000_000_000
+
+# A modified file must be unchanged this long before it is reloaded
+_STABILITY_NS = 2 * _NS_PER_SECOND
+
 
 @dataclass
 class SalesData:
@@ -115,14 +121,15 @@ class DashboardState:
         last_update: Timestamp of last data update
         last_file_mtime: Last known file modification time
         error_message: Current error message if any
-        last_poll_check: Timestamp of last polling check
+        last_poll_check: time.monotonic_ns() value of the last polling
+            check
     """
     current_file: Optional[Path] = None
     sales_data: Optional[SalesData] = None
     last_update: Optional[datetime] = None
     last_file_mtime: Optional[float] = None
     error_message: Optional[str] = None
-    last_poll_check: Optional[datetime] = None
+    last_poll_check: Optional[int] = None
 
     def should_reload(
         self,
@@ -151,35 +158,34 @@ class DashboardState:
         if self.current_file is None or self.last_file_mtime is None:
             return False
 
-        # Debounce: Don't check too frequently
-        now = datetime.now()
+        # Debounce: Don't check too frequently. The monotonic clock is
+        # immune to wall-clock changes and needs no datetime objects.
+        now_ns = time.monotonic_ns()
         if self.last_poll_check is not None:
-            time_since_last_check = (
-                (now - self.last_poll_check).total_seconds()
-            )
-            if time_since_last_check < debounce_seconds:
+            time_since_last_check_ns = now_ns - self.last_poll_check
+            if time_since_last_check_ns < debounce_seconds * _NS_PER_SECOND:
                 return False
 
         # Update last poll check time
-        self.last_poll_check = now
+        self.last_poll_check = now_ns
 
-        # Check if file still exists (fast check)
-        if not file_scanner.file_exists(self.current_file):
-            return False
-
-        # Get current modification time
+        # One stat call both checks existence and reads the mtime
         try:
-            current_mtime = file_scanner.get_file_modified_time(
-                self.current_file
-            ).timestamp()
+            file_stats = file_scanner.stat_once(self.current_file)
+            if file_stats is None:
+                return False
+            current_mtime = file_stats.st_mtime
 
             # Compare with last known modification time
             # Only reload if file is actually newer
             if current_mtime > self.last_file_mtime:
                 # Additional debounce: ensure file is stable
-                # (not being actively written)
-                time_since_modification = now.timestamp() - current_mtime
-                if time_since_modification >= 2:  # 2 second stability check
+                # (not being actively written); mtimes are wall-clock
+                # times, so this compares against time.time_ns()
+                time_since_modification_ns = (
+                    time.time_ns() - file_stats.st_mtime_ns
+                )
+                if time_since_modification_ns >= _STABILITY_NS:
                     return True
 
             return False
@@ -5,9 +5,11 @@ settings with a strongly-typed model.
 """
 
 import datetime as dt
+import functools
 import os
+import time
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Optional, Tuple
 
 
 # Default output directory
@@ -24,6 +26,58 @@ VALID_INTERVALS = {
     "60 minutes",
 }
 
+# Interval durations in seconds
+_INTERVAL_SECONDS = {
+    "5 minutes": 5 * 60,
+    "15 minutes": 15 * 60,
+    "30 minutes": 30 * 60,
+    "60 minutes": 60 * 60,
+}
+
+# Sorted interval list used in validation messages
+_VALID_INTERVALS_TEXT = ", ".join(sorted(VALID_INTERVALS))
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_report_dates(
+    date_from: str, date_to: str
+) -> Tuple[dt.date, dt.date]:
+    """Parse the report date range, memoized per pair of strings.
+
+    Settings are saved as their __dict__, so parsed dates are cached
+    here rather than on the instance.
+
+    Args:
+        date_from: Start date string (YYYY-MM-DD)
+        date_to: End date string (YYYY-MM-DD)
+
+    Returns:
+        Tuple of (start date, end date)
+
+    Raises:
+        ValueError: If either string is not an ISO date
+    """
+    return dt.date.fromisoformat(date_from), dt.date.fromisoformat(date_to)
+
+
+# How long a company-file existence check is reused (nanoseconds)
+_PATH_CHECK_INTERVAL_NS = 5 * 1_000_000_000
+
+
+@functools.lru_cache(maxsize=32)
+def _path_exists_cached(path: str, check_tick: int) -> bool:
+    """Check whether a path exists, memoized per time window.
+
+    Args:
+        path: Path to check
+        check_tick: Index of the current check window; a new window
+            forces a fresh check
+
+    Returns:
+        True if the path exists, False otherwise
+    """
+    return os.path.exists(path)
+
 
 @dataclass
 class Settings:
@@ -62,13 +116,14 @@ class Settings:
         if self.interval not in VALID_INTERVALS:
             raise ValueError(
                 f"Invalid interval: {self.interval}. "
-                f"Must be one of: {', '.join(sorted(VALID_INTERVALS))}"
+                f"Must be one of: {_VALID_INTERVALS_TEXT}"
             )
         
         # Validate date format and range
         try:
-            date_from = dt.date.fromisoformat(self.report_date_from)
-            date_to = dt.date.fromisoformat(self.report_date_to)
+            date_from, date_to = _parse_report_dates(
+                self.report_date_from, self.report_date_to
+            )
             
             if date_from > date_to:
                 raise ValueError(
@@ -84,7 +139,12 @@ class Settings:
             raise
         
         # Validate company file if provided
-        if self.company_file and not os.path.exists(self.company_file):
+        # Repeated validation reuses the existence check for a few
+        # seconds instead of hitting the file system every time
+        check_tick = time.monotonic_ns() // _PATH_CHECK_INTERVAL_NS
+        if self.company_file and not _path_exists_cached(
+            self.company_file, check_tick
+        ):
             raise ValueError(f"Company file does not exist: {self.company_file}")
 
     def get_interval_seconds(self) -> int:
@@ -96,17 +156,10 @@ class Settings:
         Raises:
             ValueError: If interval is invalid
         """
-        interval_map = {
-            "5 minutes": 5 * 60,
-            "15 minutes": 15 * 60,
-            "30 minutes": 30 * 60,
-            "60 minutes": 60 * 60,
-        }
-        
-        if self.interval not in interval_map:
-            raise ValueError(f"Invalid interval: {self.interval}")
-        
-        return interval_map[self.interval]
+        try:
+            return _INTERVAL_SECONDS[self.interval]
+        except KeyError:
+            raise ValueError(f"Invalid interval: {self.interval}") from None
 
     def ensure_output_directory(self) -> None:
         """Ensure output directory exists.
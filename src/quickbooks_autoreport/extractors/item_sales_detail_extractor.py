@@ -7,31 +7,370 @@ organizes it into structured pandas DataFrames for analysis.
 Convention: Memo field contains Product Name (Gasco-specific).
 """
 
+import functools
+import importlib.util
 import logging
+import os
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Iterator, Optional
 
 import pandas as pd
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Product code prefix of a product header row in the Type column
+# "A00403 (BELCA Vinagre...)" -> "A00403"
+_PRODUCT_CODE_RE = re.compile(r'^([A-Z0-9\-]+)\s*\(')
+
+# Date format used by QuickBooks CSV exports
+DATE_FORMAT = "%m/%d/%Y"
+
+# Numeric columns of a transaction line
+_NUMERIC_COLUMNS = ("Qty", "Sales Price", "Amount", "Balance")
+
+# Type values that start a new report section
+_SECTION_MARKERS = frozenset({"Parts", "Service", "Other Charges", "TOTAL"})
+
+# Type values of transaction lines, and the subset that are returns
+_TRANSACTION_TYPES = frozenset({
+    "Invoice",
+    "Credit Memo",
+    "Sales Receipt",
+    "Refund Receipt",
+    "Statement Charge",
+})
+_RETURN_TYPES = frozenset({"Credit Memo", "Refund Receipt"})
+
+# Raw and helper columns left out of the transactions frame
+_DROPPED_COLUMNS = frozenset({"Job", "Is_Section_Break", "Section"})
+
+# Grouping keys stored as categoricals on the transactions frame
+# (Type is converted earlier, when the return flag is derived)
+_CATEGORY_COLUMNS = ("Product_Name", "Customer", "Num")
+
+# Use pyarrow's multithreaded CSV parser when it is installed
+PYARROW_CSV_ENABLED: bool = importlib.util.find_spec("pyarrow") is not None
+
+# Derived frames are cached as Parquet next to the CSV when pyarrow is
+# available
+PARQUET_CACHE_ENABLED: bool = PYARROW_CSV_ENABLED
+
+# Version of the derived frames; bump it whenever a derivation changes
+# so frames cached by older code are not reused
+_CACHE_FORMAT_VERSION = 1
+
+
+def _divide_nonzero(
+    numerator: pd.Series, denominator: pd.Series
+) -> np.ndarray:
+    """
+    Divide element-wise, yielding NaN where the denominator is zero.
+
+    Only the safe positions are divided, so no temporary quotient
+    array or divide-by-zero warning is produced.
+
+    Args:
+        numerator: Dividend values
+        denominator: Divisor values
+
+    Returns:
+        Float array of quotients
+    """
+    num = numerator.to_numpy(dtype=np.float64)
+    den = denominator.to_numpy(dtype=np.float64)
+    out = np.full(den.shape, np.nan)
+    np.divide(num, den, out=out, where=den != 0)
+    return out
+
+
+def _customer_names(names: pd.Series) -> pd.Series:
+    """
+    Strip the ":job" suffix from QuickBooks "Customer:Job" names.
+
+    Arrow-backed strings are split with a single pyarrow compute
+    kernel; other string columns use a regex replace. Neither builds
+    an expanded split DataFrame.
+
+    Args:
+        names: Name column of the transaction lines
+
+    Returns:
+        Customer part of each name, with the same dtype and index
+    """
+    if getattr(names.dtype, "storage", None) == "pyarrow":
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        parts = pc.split_pattern(pa.array(names.array), ":", max_splits=1)
+        return pd.Series(
+            pd.array(pc.list_element(parts, 0), dtype=names.dtype),
+            index=names.index,
+            name=names.name,
+        )
+
+    return names.str.replace(r"(?s):.*", "", regex=True)
+
+
+def _read_csv_options(csv_path: Path) -> Dict[str, Any]:
+    """
+    Build read_csv keyword arguments for a QuickBooks CSV export.
+
+    The Date column, when present, is parsed by the CSV reader itself
+    rather than in a separate pass.
+
+    Args:
+        csv_path: Path to CSV file
+
+    Returns:
+        Keyword arguments for pd.read_csv
+    """
+    read_options: Dict[str, Any] = {"encoding": "latin-1"}
+    header = pd.read_csv(csv_path, encoding="latin-1", nrows=0).columns
+    if "Date" in header:
+        read_options.update(parse_dates=["Date"], date_format=DATE_FORMAT)
+    return read_options
+
+
+def _read_csv(csv_path: Path) -> pd.DataFrame:
+    """
+    Read a QuickBooks CSV export, preferring the pyarrow engine.
+
+    Falls back to the default C parser when pyarrow is not installed
+    or cannot parse the file.
+
+    Args:
+        csv_path: Path to CSV file
+
+    Returns:
+        Raw DataFrame with pandas' column naming conventions
+    """
+    read_options = _read_csv_options(csv_path)
+
+    if PYARROW_CSV_ENABLED:
+        try:
+            df = pd.read_csv(csv_path, engine="pyarrow", **read_options)
+        except ValueError as e:
+            logger.warning(
+                f"⚠️ pyarrow could not parse {csv_path}, "
+                f"falling back to the C parser: {str(e)}"
+            )
+        else:
+            # pyarrow keeps blank headers as ""; match the C parser
+            df.columns = [
+                name or f"Unnamed: {i}" for i, name in enumerate(df.columns)
+            ]
+            return df
+
+    return pd.read_csv(csv_path, **read_options)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_csv_cached(
+    path_str: str, mtime_ns: int, size: int
+) -> pd.DataFrame:
+    """
+    Parse a CSV export once per (path, mtime, size) version.
+
+    The modification time and size are part of the cache key, so an
+    edited file is parsed again. Callers must copy the result before
+    mutating it.
+
+    Args:
+        path_str: Path to CSV file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+
+    Returns:
+        Shared raw DataFrame for this file version
+    """
+    return _read_csv(Path(path_str))
+
+
+def _cache_dir_for(csv_path: Path) -> Optional[Path]:
+    """
+    Get the Parquet cache directory for the current version of a CSV.
+
+    Cached frames live in "<csv name>.cache/v<format>-<mtime_ns>/", so
+    neither a modified CSV nor a changed derivation reads frames cached
+    for an older version.
+
+    Args:
+        csv_path: Path to CSV file
+
+    Returns:
+        Cache directory, or None if caching is disabled or the CSV
+        cannot be stat'ed
+    """
+    if not PARQUET_CACHE_ENABLED:
+        return None
+    try:
+        mtime_ns = os.stat(csv_path).st_mtime_ns
+    except OSError:
+        return None
+    return (
+        csv_path.parent
+        / f"{csv_path.name}.cache"
+        / f"v{_CACHE_FORMAT_VERSION}-{mtime_ns}"
+    )
+
+
+def _read_cached_frame(
+    cache_dir: Optional[Path], name: str
+) -> Optional[pd.DataFrame]:
+    """
+    Read a derived frame from the Parquet cache.
+
+    Args:
+        cache_dir: Cache directory from _cache_dir_for, or None
+        name: Frame name (e.g. "transactions")
+
+    Returns:
+        Cached DataFrame, or None if it is not cached or unreadable
+    """
+    if cache_dir is None:
+        return None
+
+    cache_path = cache_dir / f"{name}.parquet"
+    try:
+        df = pd.read_parquet(cache_path, engine="pyarrow")
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(
+            f"⚠️ Ignoring unreadable Parquet cache {cache_path}: {str(e)}"
+        )
+        return None
+
+    logger.info(f"📥 Loaded {name} from Parquet cache ({len(df)} rows)")
+    return df
+
+
+def _write_cached_frame(
+    cache_dir: Optional[Path], name: str, df: pd.DataFrame
+) -> None:
+    """
+    Write a derived frame to the Parquet cache.
+
+    Cache directories of older CSV versions are removed. Failures are
+    logged and ignored; the cache is an optimization.
+
+    Args:
+        cache_dir: Cache directory from _cache_dir_for, or None
+        name: Frame name (e.g. "transactions")
+        df: DataFrame to persist
+    """
+    if cache_dir is None:
+        return
+
+    cache_path = cache_dir / f"{name}.parquet"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for stale_dir in cache_dir.parent.iterdir():
+            if stale_dir != cache_dir and stale_dir.is_dir():
+                shutil.rmtree(stale_dir, ignore_errors=True)
+        df.to_parquet(cache_path, engine="pyarrow", compression="zstd")
+        logger.debug(f"Wrote Parquet cache {cache_path}")
+    except Exception as e:
+        logger.warning(
+            f"⚠️ Failed to write Parquet cache {cache_path}: {str(e)}"
+        )
+
+
+def _assign_product_codes(
+    raw: pd.DataFrame, carry_code: Optional[str] = None
+) -> Optional[str]:
+    """
+    Add Product_Code, Is_Section_Break and Section columns to raw rows.
+
+    Product codes come from product header rows and are forward
+    filled onto the lines below them, but never across a section
+    break (Parts, Service, Other Charges, TOTAL).
+
+    Args:
+        raw: Raw report rows; modified in place
+        carry_code: Product code in effect before the first row, used
+            when the report is processed in chunks
+
+    Returns:
+        Product code in effect after the last row, or None
+    """
+    # Extract product codes from Type column
+    # Pattern: "A00403 (BELCA Vinagre...)" -> extract "A00403"
+    product_codes = raw["Type"].str.extract(_PRODUCT_CODE_RE, expand=False)
+
+    # Identify section breaks (Parts, Service, Other Charges, etc.)
+    raw["Is_Section_Break"] = raw["Type"].isin(_SECTION_MARKERS)
+
+    # Create section groups - reset at each section break
+    section = raw["Is_Section_Break"].cumsum().to_numpy(np.int32)
+    raw["Section"] = section
+
+    # Forward fill product codes only within each section: carry the
+    # position of the last row holding a code, then drop carried codes
+    # whose row sits in an earlier section
+    positions = np.arange(len(product_codes))
+    carrier = np.maximum.accumulate(
+        np.where(product_codes.notna().to_numpy(), positions, -1)
+    )
+    carrier_clipped = np.maximum(carrier, 0)
+    same_section = (carrier >= 0) & (section[carrier_clipped] == section)
+    filled = (
+        product_codes.iloc[carrier_clipped]
+        .set_axis(product_codes.index)
+        .where(same_section)
+    )
+    if carry_code is not None:
+        # Leading rows continue the previous chunk's product until the
+        # first code or section break of this chunk
+        filled = filled.mask((carrier < 0) & (section == 0), carry_code)
+    raw["Product_Code"] = filled
+
+    if len(filled) == 0:
+        return carry_code
+    last_code = filled.iloc[-1]
+    return None if pd.isna(last_code) else last_code
+
+
+def _select_transactions(raw: pd.DataFrame) -> pd.DataFrame:
+    """
+    Select transaction lines from raw rows with assigned product codes.
+
+    Args:
+        raw: Raw report rows processed by _assign_product_codes
+
+    Returns:
+        New DataFrame holding only the transaction lines
+    """
+    # Prune unneeded columns before the copy so they are never copied
+    kept_columns = [col for col in raw.columns if col not in _DROPPED_COLUMNS]
+    return raw.loc[raw["Type"].isin(_TRANSACTION_TYPES), kept_columns].copy()
+
 
 class ItemSalesDetailExtractor:
     """Extract and organize Item Sales Detail report data."""
 
-    def __init__(self, csv_path: Path):
+    def __init__(self, csv_path: Path, chunksize: Optional[int] = None):
         """
         Initialize extractor with CSV file path.
 
         Args:
             csv_path: Path to QuickBooks Item Sales Detail CSV export
+            chunksize: If set, stream the CSV in chunks of this many rows
+                when extracting transactions, keeping only transaction
+                lines in memory instead of the whole raw report
         """
         self.csv_path = csv_path
+        self.chunksize = chunksize
         self._raw_df: Optional[pd.DataFrame] = None
         self._transactions_df: Optional[pd.DataFrame] = None
         self._product_summary_df: Optional[pd.DataFrame] = None
         self._customer_product_df: Optional[pd.DataFrame] = None
+        # Parquet cache directory, set when extraction reads the file
+        self._cache_dir: Optional[Path] = None
 
     def load_raw_data(self) -> pd.DataFrame:
         """
@@ -41,11 +380,37 @@ class ItemSalesDetailExtractor:
             Raw DataFrame with all rows from CSV
         """
         logger.info(f"📥 Loading raw data from {self.csv_path}")
-        self._raw_df = pd.read_csv(self.csv_path, encoding="latin-1")
+        file_stats = Path(self.csv_path).stat()
+        # Copy the shared cached frame; extraction adds columns to it
+        self._raw_df = _read_csv_cached(
+            str(self.csv_path), file_stats.st_mtime_ns, file_stats.st_size
+        ).copy()
 
         logger.info(f"✅ Loaded {len(self._raw_df)} rows")
         return self._raw_df
 
+    def _iter_transaction_chunks(self) -> Iterator[pd.DataFrame]:
+        """
+        Stream the CSV and yield the transaction lines of each chunk.
+
+        The product code in effect at the end of a chunk is carried
+        into the next one, so the result matches a whole-file parse.
+
+        Yields:
+            Transaction lines of each chunk of the raw report
+        """
+        logger.info(
+            f"📥 Streaming {self.csv_path} in chunks of {self.chunksize} rows"
+        )
+        carry_code: Optional[str] = None
+        for chunk in pd.read_csv(
+            self.csv_path,
+            chunksize=self.chunksize,
+            **_read_csv_options(self.csv_path)
+        ):
+            carry_code = _assign_product_codes(chunk, carry_code)
+            yield _select_transactions(chunk)
+
     def extract_transactions(self) -> pd.DataFrame:
         """
         Extract transaction-level data (invoices, credit memos, etc.).
@@ -55,98 +420,69 @@ class ItemSalesDetailExtractor:
         Returns:
             DataFrame with transaction lines only
         """
-        if self._raw_df is None:
-            self.load_raw_data()
-
         logger.info("🎯 Extracting transaction lines")
 
-        # Extract product codes from Type column
-        # Pattern: "A00403 (BELCA Vinagre...)" -> extract "A00403"
-        product_code_pattern = r'^([A-Z0-9\-]+)\s*\('
-        self._raw_df["Product_Code"] = self._raw_df["Type"].str.extract(
-            product_code_pattern, expand=False
-        )
-
-        # Identify section breaks (Parts, Service, Other Charges, etc.)
-        section_markers = [
-            "Parts", "Service", "Other Charges", "TOTAL"
-        ]
-        self._raw_df["Is_Section_Break"] = self._raw_df[
-            "Type"
-        ].isin(section_markers)
-
-        # Create section groups - reset at each section break
-        self._raw_df["Section"] = self._raw_df[
-            "Is_Section_Break"
-        ].cumsum()
-
-        # Forward fill product codes only within each section
-        self._raw_df["Product_Code"] = self._raw_df.groupby("Section")[
-            "Product_Code"
-        ].ffill()
-
-        # Filter to actual transaction rows
-        valid_types = [
-            "Invoice",
-            "Credit Memo",
-            "Sales Receipt",
-            "Refund Receipt",
-            "Statement Charge",
-        ]
-        transactions = self._raw_df[
-            self._raw_df["Type"].isin(valid_types)
-        ].copy()
-
-        # Map product codes to transaction rows
-        transactions["Product_Code"] = transactions.index.map(
-            self._raw_df["Product_Code"]
-        )
-
-        # Convert data types
-        transactions["Date"] = pd.to_datetime(
-            transactions["Date"], format="%m/%d/%Y", errors="coerce"
-        )
-        transactions["Qty"] = pd.to_numeric(
-            transactions["Qty"], errors="coerce"
-        )
-        transactions["Sales Price"] = pd.to_numeric(
-            transactions["Sales Price"], errors="coerce"
-        )
-        transactions["Amount"] = pd.to_numeric(
-            transactions["Amount"], errors="coerce"
-        )
-        transactions["Balance"] = pd.to_numeric(
-            transactions["Balance"], errors="coerce"
+        # Derived frames are only cached when they come straight from
+        # the CSV file
+        self._cache_dir = (
+            _cache_dir_for(Path(self.csv_path))
+            if self._raw_df is None else None
         )
+        cached = _read_cached_frame(self._cache_dir, "transactions")
+        if cached is not None:
+            self._transactions_df = cached
+            return self._transactions_df
+
+        if self._raw_df is None and self.chunksize is not None:
+            transactions = pd.concat(list(self._iter_transaction_chunks()))
+        else:
+            if self._raw_df is None:
+                self.load_raw_data()
+            _assign_product_codes(self._raw_df)
+            transactions = _select_transactions(self._raw_df)
+
+        # Convert data types; the CSV reader normally parses these
+        # already, so each column is only converted when it is not
+        if not pd.api.types.is_datetime64_any_dtype(transactions["Date"]):
+            transactions["Date"] = pd.to_datetime(
+                transactions["Date"], format=DATE_FORMAT, errors="coerce"
+            )
+        for column in _NUMERIC_COLUMNS:
+            if not pd.api.types.is_numeric_dtype(transactions[column]):
+                transactions[column] = pd.to_numeric(
+                    transactions[column], errors="coerce"
+                )
 
         # Clean up Memo field (Product Name)
         transactions["Product_Name"] = transactions["Memo"].str.strip()
 
         # Add derived fields
-        transactions["Is_Return"] = transactions["Type"].isin(
-            ["Credit Memo", "Refund Receipt"]
+        # Type has only a handful of values, so the return flag is an
+        # integer membership test on its category codes
+        transactions["Type"] = transactions["Type"].astype("category")
+        type_categories = transactions["Type"].cat.categories
+        return_codes = [
+            code for code, value in enumerate(type_categories)
+            if value in _RETURN_TYPES
+        ]
+        transactions["Is_Return"] = np.isin(
+            transactions["Type"].cat.codes.to_numpy(), return_codes
         )
-        transactions["Realized_Unit_Price"] = np.where(
-            transactions["Qty"] != 0,
-            transactions["Amount"] / transactions["Qty"],
-            np.nan
+        transactions["Realized_Unit_Price"] = _divide_nonzero(
+            transactions["Amount"], transactions["Qty"]
         )
 
-        # Split customer and job
-        split_result = transactions["Name"].str.split(":", n=1, expand=True)
-        transactions["Customer"] = split_result[0]
-
-        # Drop unnecessary columns
-        columns_to_drop = ["Job", "Is_Section_Break", "Section"]
-        transactions = transactions.drop(
-            columns=[
-                col for col in columns_to_drop if col in transactions.columns
-            ],
-            errors="ignore"
-        )
+        # Split customer and job; only the customer part is kept
+        transactions["Customer"] = _customer_names(transactions["Name"])
+
+        # Categorical keys let later groupbys work on integer codes
+        # instead of hashing the strings again
+        for column in _CATEGORY_COLUMNS:
+            transactions[column] = transactions[column].astype("category")
 
         self._transactions_df = transactions
         logger.info(f"✅ Extracted {len(transactions)} transaction lines")
+        _write_cached_frame(self._cache_dir, "transactions", transactions)
 
         return self._transactions_df
 
@@ -160,43 +496,45 @@ class ItemSalesDetailExtractor:
         if self._transactions_df is None:
             self.extract_transactions()
 
-        logger.info("📊 Creating product summary")
-
-        # Separate sales and returns
-        sales = self._transactions_df[
-            ~self._transactions_df["Is_Return"]
-        ].copy()
-        returns = self._transactions_df[
-            self._transactions_df["Is_Return"]
-        ].copy()
+        cached = _read_cached_frame(self._cache_dir, "product_summary")
+        if cached is not None:
+            self._product_summary_df = cached
+            return self._product_summary_df
 
-        # Aggregate sales
-        sales_agg = sales.groupby("Product_Name").agg({
-            "Qty": "sum",
-            "Amount": "sum",
-            "Num": "count",  # Transaction count
-            "Product_Code": lambda x: (
-                x.dropna().iloc[0] if len(x.dropna()) > 0 else ""
-            )
-        }).rename(columns={
-            "Qty": "Sales_Qty",
-            "Amount": "Sales_Amount",
-            "Num": "Sales_Transactions"
-        })
-
-        # Aggregate returns (convert to positive for clarity)
-        returns_agg = returns.groupby("Product_Name").agg({
-            "Qty": lambda x: abs(x.sum()),
-            "Amount": lambda x: abs(x.sum()),
-            "Num": "count"
-        }).rename(columns={
-            "Qty": "Return_Qty",
-            "Amount": "Return_Amount",
-            "Num": "Return_Transactions"
-        })
+        logger.info("📊 Creating product summary")
 
-        # Combine
-        summary = sales_agg.join(returns_agg, how="outer").fillna(0)
+        # Aggregate sales and returns in one grouped pass; "first"
+        # skips nulls, giving the first product code on the Cython path
+        grouped = self._transactions_df.groupby(
+            ["Product_Name", "Is_Return"], observed=True
+        ).agg(
+            Qty=("Qty", "sum"),
+            Amount=("Amount", "sum"),
+            Transactions=("Num", "count"),
+            Product_Code=("Product_Code", "first"),
+        ).unstack("Is_Return")
+        # Keep both halves even when there are no sales or no returns
+        grouped = grouped.reindex(columns=pd.MultiIndex.from_product(
+            [grouped.columns.levels[0], [False, True]],
+            names=grouped.columns.names
+        ))
+        sales = grouped.xs(False, axis=1, level="Is_Return")
+        returns = grouped.xs(True, axis=1, level="Is_Return")
+
+        # Product code comes from sales lines; products without a
+        # coded sales line get an empty string
+        product_code = sales["Product_Code"].astype(object).fillna("")
+
+        # Returns are converted to positive for clarity
+        summary = pd.DataFrame({
+            "Sales_Qty": sales["Qty"],
+            "Sales_Amount": sales["Amount"],
+            "Sales_Transactions": sales["Transactions"],
+            "Product_Code": product_code,
+            "Return_Qty": returns["Qty"].abs(),
+            "Return_Amount": returns["Amount"].abs(),
+            "Return_Transactions": returns["Transactions"],
+        }).fillna(0)
 
         # Calculate net values
         summary["Net_Qty"] = (
@@ -210,10 +548,8 @@ class ItemSalesDetailExtractor:
         summary["Total_Qty"] = summary["Sales_Qty"] + summary["Return_Qty"]
 
         # Calculate average unit price
-        summary["Avg_Unit_Price"] = np.where(
-            summary["Net_Qty"] != 0,
-            summary["Net_Amount"] / summary["Net_Qty"],
-            np.nan
+        summary["Avg_Unit_Price"] = _divide_nonzero(
+            summary["Net_Amount"], summary["Net_Qty"]
         )
 
         # Filter out products with no activity (all quantities are 0)
@@ -228,6 +564,9 @@ class ItemSalesDetailExtractor:
 
         self._product_summary_df = summary.reset_index()
         logger.info(f"✅ Created summary for {len(summary)} products")
+        _write_cached_frame(
+            self._cache_dir, "product_summary", self._product_summary_df
+        )
 
         return self._product_summary_df
 
@@ -241,11 +580,18 @@ class ItemSalesDetailExtractor:
         if self._transactions_df is None:
             self.extract_transactions()
 
+        cached = _read_cached_frame(
+            self._cache_dir, "customer_product_matrix"
+        )
+        if cached is not None:
+            self._customer_product_df = cached
+            return self._customer_product_df
+
         logger.info("📊 Creating customer-product matrix")
 
         # Aggregate by customer and product
         matrix = self._transactions_df.groupby(
-            ["Customer", "Product_Name"]
+            ["Customer", "Product_Name"], observed=True
         ).agg({
             "Qty": "sum",
             "Amount": "sum",
@@ -272,6 +618,10 @@ class ItemSalesDetailExtractor:
             f"✅ Created matrix with {len(matrix)} "
             "customer-product combinations"
         )
+        _write_cached_frame(
+            self._cache_dir, "customer_product_matrix",
+            self._customer_product_df
+        )
 
         return self._customer_product_df
 
@@ -303,15 +653,19 @@ class ItemSalesDetailExtractor:
         if self._transactions_df is None:
             self.extract_transactions()
 
-        customer_summary = self._transactions_df.groupby("Customer").agg({
+        customer_summary = self._transactions_df.groupby(
+            "Customer", observed=True
+        ).agg({
             "Amount": "sum",
             "Num": "count"
         }).rename(columns={
             "Amount": "Total_Amount",
             "Num": "Transaction_Count"
-        }).sort_values("Total_Amount", ascending=False)
+        })
 
-        return customer_summary.head(n).reset_index()
+        # Partial selection of the top n instead of sorting every
+        # customer
+        return customer_summary.nlargest(n, "Total_Amount").reset_index()
 
     def create_backordered_items(self) -> pd.DataFrame:
         """
@@ -328,34 +682,31 @@ class ItemSalesDetailExtractor:
 
         logger.info("📊 Creating backordered items report")
         
-        # Filter transactions with Qty = 0 (backordered)
-        backordered = self._transactions_df[
-            self._transactions_df["Qty"] == 0
-        ].copy()
+        # Filter transactions with Qty = 0 (backordered), selecting
+        # the report columns in the same step; .loc already returns a
+        # new frame, so no defensive copies are needed
+        report_columns = ["Product_Code", "Product_Name", "Num", "Customer"]
+        backordered_report = self._transactions_df.loc[
+            self._transactions_df["Qty"].to_numpy() == 0, report_columns
+        ]
         
-        if len(backordered) == 0:
+        if len(backordered_report) == 0:
             logger.info("✅ No backordered items found")
-            return pd.DataFrame(
-                columns=["Product_Code", "Product_Name", "Num", "Customer"]
-            )
-        
-        # Select and rename columns
-        backordered_report = backordered[
-            ["Product_Code", "Product_Name", "Num", "Customer"]
-        ].copy()
+            return pd.DataFrame(columns=report_columns)
         
         # Rename Num to Invoice_Number for clarity
         backordered_report = backordered_report.rename(
             columns={"Num": "Invoice_Number"}
         )
         
-        # Remove duplicates (one row per invoice number + product)
-        backordered_report = backordered_report.drop_duplicates()
-        
-        # Sort by Invoice_Number
-        backordered_report = backordered_report.sort_values(
-            "Invoice_Number"
-        )
+        # One row per invoice number + product; the sorted groupby
+        # dedups and orders by Invoice_Number in a single pass
+        backordered_report = backordered_report.groupby(
+            ["Invoice_Number", "Product_Code"],
+            sort=True, dropna=False, observed=True
+        )[["Product_Name", "Customer"]].first().reset_index()[
+            ["Product_Code", "Product_Name", "Invoice_Number", "Customer"]
+        ]
         
         logger.info(
             f"✅ Found {len(backordered_report)} backordered items"
@@ -378,7 +729,9 @@ class ItemSalesDetailExtractor:
         logger.info("📊 Creating transaction summary")
 
         # Group by transaction number
-        transaction_summary = self._transactions_df.groupby("Num").agg({
+        transaction_summary = self._transactions_df.groupby(
+            "Num", observed=True
+        ).agg({
             "Date": "first",
             "Type": "first",
             "Name": "first",
@@ -408,15 +761,42 @@ class ItemSalesDetailExtractor:
         """
         logger.info("📦 Generating all DataFrames")
 
-        return {
-            "transactions": self.extract_transactions(),
-            "product_summary": self.create_product_summary(),
-            "customer_product_matrix": self.create_customer_product_matrix(),
-            "transaction_summary": self.create_transaction_summary(),
-            "backordered_items": self.create_backordered_items(),
-            "top_products": self.get_top_products(),
-            "top_customers": self.get_top_customers()
-        }
+        # Everything below only reads the transactions frame, so it is
+        # extracted first and the summaries are built concurrently;
+        # pandas releases the GIL in much of the aggregation work
+        transactions = self.extract_transactions()
+
+        with ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="sales-summary"
+        ) as executor:
+            product_summary = executor.submit(self.create_product_summary)
+
+            def top_products() -> pd.DataFrame:
+                # Reuse the summary being built instead of racing it
+                product_summary.result()
+                return self.get_top_products()
+
+            futures = {
+                "product_summary": product_summary,
+                "customer_product_matrix": executor.submit(
+                    self.create_customer_product_matrix
+                ),
+                "transaction_summary": executor.submit(
+                    self.create_transaction_summary
+                ),
+                "backordered_items": executor.submit(
+                    self.create_backordered_items
+                ),
+                "top_products": executor.submit(top_products),
+                "top_customers": executor.submit(self.get_top_customers),
+            }
+
+            dataframes = {"transactions": transactions}
+            dataframes.update(
+                (name, future.result()) for name, future in futures.items()
+            )
+
+        return dataframes
 
 
 def extract_sales_data(csv_path: Path) -> Dict[str, pd.DataFrame]:
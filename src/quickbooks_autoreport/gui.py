@@ -6,22 +6,45 @@ configuration management, and scheduling capabilities.
 
 import datetime as dt
 import os
+import queue
 import subprocess
 import sys
 import threading
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 
 from . import (
     REPORT_CONFIGS,
     DEFAULT_OUT_DIR,
+    INTERVAL_OPTIONS,
     load_settings,
     save_settings,
     export_all_reports,
 )
 from .services.scheduler import SchedulerManager
-from .utils.logging_utils import log_info, log_error, log_success
+from .utils.logging_utils import log_info, log_error
+
+
+# Interval combobox choices, in the order defined by the config
+_INTERVAL_CHOICES = tuple(INTERVAL_OPTIONS)
+
+# Fixed-width font for the composite per-report status lines
+_REPORT_LINE_FONT = ("Consolas", 10)
+
+# How often (ms) the UI thread drains updates queued by worker threads
+_UI_PUMP_INTERVAL_MS = 50
+
+# How long (ms) a cached dt.date.today() value is reused
+_TODAY_CACHE_MS = 60_000
+
+# Quiet period (ms) before date edits are pushed to the scheduler
+_DATE_UPDATE_DEBOUNCE_MS = 250
+
+
+def _format_report_line(status: str, rows: str, excel: str) -> str:
+    """Format one report's status, row count and Excel marker as a line."""
+    return f"{status:<12}│ {rows:>8} │ {excel}"
 
 
 class QuickBooksAutoReporterGUI:
@@ -38,11 +61,21 @@ class QuickBooksAutoReporterGUI:
         self.settings = load_settings()
         self.output_dir = self.settings["output_dir"]
         self.selected_interval = self.settings["interval"]
+        # Copy of the settings as last persisted, used to skip no-op saves
+        self._settings_saved_snapshot = dict(self.settings)
         
         # State variables
         self.scheduler_manager = SchedulerManager()
         self.last_export_time = None
         self.last_export_results = {}
+        self._export_thread: Optional[threading.Thread] = None
+        # Last value written to each StringVar, keyed by id(var)
+        self._var_values: Dict[int, str] = {}
+        # Updates posted from worker threads, applied on the UI thread
+        self._ui_queue: queue.Queue = queue.Queue()
+        # Pending debounced scheduler date-range update
+        self._date_update_after: Optional[str] = None
+        self._today_cache: Optional[dt.date] = None
         
         # Create GUI variables
         self.status_var = tk.StringVar(value="Idle")
@@ -54,14 +87,16 @@ class QuickBooksAutoReporterGUI:
         self.date_from_var = tk.StringVar(value=self.settings["report_date_from"])
         self.date_to_var = tk.StringVar(value=self.settings["report_date_to"])
         
-        # Report status variables
-        self.report_status_vars = {}
-        for report_key in REPORT_CONFIGS.keys():
-            self.report_status_vars[report_key] = {
-                "status": tk.StringVar(value="-"),
-                "rows": tk.StringVar(value="-"),
-                "excel": tk.StringVar(value="-"),
-            }
+        # Report status: one display line per report, composed from the
+        # report's current [status, rows, excel] fields
+        initial_line = _format_report_line("-", "-", "-")
+        self.report_line_vars = {
+            report_key: tk.StringVar(value=initial_line)
+            for report_key in REPORT_CONFIGS
+        }
+        self._report_states = {
+            report_key: ["-", "-", "-"] for report_key in REPORT_CONFIGS
+        }
         
         # Set up scheduler callbacks
         self.scheduler_manager.set_callbacks(
@@ -69,14 +104,27 @@ class QuickBooksAutoReporterGUI:
             error_callback=self.on_scheduler_error
         )
         
+        # Build the widget tree while withdrawn so Tk lays it out once
+        self.root.withdraw()
         self.create_widgets()
-        self.start_timer_display()
+        self.root.deiconify()
+        # First tick runs once the mainloop is idle, then reschedules itself
+        self._tick_after_id = self.root.after_idle(self._tick)
+        self._pump_after_id = self.root.after(
+            _UI_PUMP_INTERVAL_MS, self._drain_ui_queue
+        )
         
         # Save settings on close
         self.root.protocol("WM_DELETE_WINDOW", self.on_exit)
     
     def create_widgets(self) -> None:
         """Create all GUI widgets."""
+        # Default fonts for buttons and section frames via the option
+        # database; those widgets only pass font= where they differ.
+        # Other widgets keep Tk's default font.
+        self.root.option_add("*Button.Font", "{Segoe UI} 10 bold")
+        self.root.option_add("*Labelframe.Font", "{Segoe UI} 10 bold")
+        
         # Title
         title_frame = tk.Frame(self.root)
         title_frame.pack(pady=(10, 5))
@@ -96,9 +144,7 @@ class QuickBooksAutoReporterGUI:
         ).pack()
         
         # Configuration section
-        config_frame = tk.LabelFrame(
-            self.root, text="Configuration", font=("Segoe UI", 10, "bold")
-        )
+        config_frame = tk.LabelFrame(self.root, text="Configuration")
         config_frame.pack(fill="x", padx=10, pady=5)
         
         # Output folder selection
@@ -111,7 +157,11 @@ class QuickBooksAutoReporterGUI:
             folder_frame, textvariable=self.folder_var, state="readonly", width=50
         ).pack(side="left", padx=5)
         tk.Button(
-            folder_frame, text="Browse...", command=self.select_folder, width=10
+            folder_frame,
+            text="Browse...",
+            command=self.select_folder,
+            width=10,
+            font="TkDefaultFont",
         ).pack(side="right")
         
         # Interval selection
@@ -123,7 +173,7 @@ class QuickBooksAutoReporterGUI:
         interval_combo = ttk.Combobox(
             interval_frame,
             textvariable=self.interval_var,
-            values=list(["5 minutes", "15 minutes", "30 minutes", "60 minutes"]),
+            values=_INTERVAL_CHOICES,
             state="readonly",
             width=15,
         )
@@ -214,7 +264,6 @@ class QuickBooksAutoReporterGUI:
             command=self.start_scheduler,
             bg="#4CAF50",
             fg="white",
-            font=("Segoe UI", 10, "bold"),
         )
         self.start_button.grid(row=0, column=0, padx=5)
         
@@ -225,20 +274,19 @@ class QuickBooksAutoReporterGUI:
             command=self.stop_scheduler,
             bg="#f44336",
             fg="white",
-            font=("Segoe UI", 10, "bold"),
             state="disabled",
         )
         self.stop_button.grid(row=0, column=1, padx=5)
         
-        tk.Button(
+        self.export_button = tk.Button(
             control_frame,
             text="Export All Now",
             width=15,
             command=self.export_now,
             bg="#2196F3",
             fg="white",
-            font=("Segoe UI", 10, "bold"),
-        ).grid(row=0, column=2, padx=5)
+        )
+        self.export_button.grid(row=0, column=2, padx=5)
         tk.Button(
             control_frame,
             text="Open Folder",
@@ -246,11 +294,10 @@ class QuickBooksAutoReporterGUI:
             command=self.open_folder,
             bg="#FF9800",
             fg="white",
-            font=("Segoe UI", 10, "bold"),
         ).grid(row=0, column=3, padx=5)
         
         # Status section
-        status_frame = tk.LabelFrame(self.root, text="Status", font=("Segoe UI", 10, "bold"))
+        status_frame = tk.LabelFrame(self.root, text="Status")
         status_frame.pack(fill="x", padx=10, pady=5)
         
         status_grid = tk.Frame(status_frame)
@@ -275,9 +322,7 @@ class QuickBooksAutoReporterGUI:
         )
         
         # Reports status
-        reports_frame = tk.LabelFrame(
-            self.root, text="Report Status", font=("Segoe UI", 10, "bold")
-        )
+        reports_frame = tk.LabelFrame(self.root, text="Report Status")
         reports_frame.pack(fill="x", padx=10, pady=5)
         
         reports_grid = tk.Frame(reports_frame)
@@ -288,14 +333,11 @@ class QuickBooksAutoReporterGUI:
             reports_grid, text="Report", font=("Segoe UI", 9, "bold"), width=20
         ).grid(row=0, column=0, padx=5, pady=2)
         tk.Label(
-            reports_grid, text="Status", font=("Segoe UI", 9, "bold"), width=15
-        ).grid(row=0, column=1, padx=5, pady=2)
-        tk.Label(
-            reports_grid, text="Rows", font=("Segoe UI", 9, "bold"), width=10
-        ).grid(row=0, column=2, padx=5, pady=2)
-        tk.Label(
-            reports_grid, text="Excel", font=("Segoe UI", 9, "bold"), width=10
-        ).grid(row=0, column=3, padx=5, pady=2)
+            reports_grid,
+            text=_format_report_line("Status", "Rows", "Excel"),
+            font=_REPORT_LINE_FONT + ("bold",),
+            anchor="w",
+        ).grid(row=0, column=1, padx=5, pady=2, sticky="w")
         
         # Report rows
         for i, (report_key, config) in enumerate(REPORT_CONFIGS.items(), 1):
@@ -304,22 +346,10 @@ class QuickBooksAutoReporterGUI:
             )
             tk.Label(
                 reports_grid,
-                textvariable=self.report_status_vars[report_key]["status"],
-                width=15,
+                textvariable=self.report_line_vars[report_key],
+                font=_REPORT_LINE_FONT,
                 anchor="w",
             ).grid(row=i, column=1, padx=5, pady=2, sticky="w")
-            tk.Label(
-                reports_grid,
-                textvariable=self.report_status_vars[report_key]["rows"],
-                width=10,
-                anchor="w",
-            ).grid(row=i, column=2, padx=5, pady=2, sticky="w")
-            tk.Label(
-                reports_grid,
-                textvariable=self.report_status_vars[report_key]["excel"],
-                width=10,
-                anchor="w",
-            ).grid(row=i, column=3, padx=5, pady=2, sticky="w")
         
         # Exit button
         tk.Button(
@@ -329,7 +359,6 @@ class QuickBooksAutoReporterGUI:
             command=self.on_exit,
             bg="#795548",
             fg="white",
-            font=("Segoe UI", 10, "bold"),
         ).pack(pady=(10, 10))
     
     def select_folder(self) -> None:
@@ -341,13 +370,13 @@ class QuickBooksAutoReporterGUI:
             self.output_dir = folder
             self.folder_var.set(folder)
             self.settings["output_dir"] = folder
-            save_settings(self.settings)
+            self._maybe_save()
     
     def on_interval_changed(self, event=None) -> None:
         """Handle interval selection change."""
         self.selected_interval = self.interval_var.get()
         self.settings["interval"] = self.selected_interval
-        save_settings(self.settings)
+        self._maybe_save()
         
         # Update scheduler if running
         if self.scheduler_manager.is_running():
@@ -355,70 +384,135 @@ class QuickBooksAutoReporterGUI:
     
     def on_date_changed(self, event=None) -> None:
         """Handle date field changes."""
+        from_date = self.date_from_var.get().strip()
+        to_date = self.date_to_var.get().strip()
+        if (
+            from_date == self.settings.get("report_date_from")
+            and to_date == self.settings.get("report_date_to")
+        ):
+            return
+        
         try:
             # Validate date format
-            from_date = self.date_from_var.get().strip()
-            to_date = self.date_to_var.get().strip()
-            
             if from_date:
-                dt.datetime.strptime(from_date, "%Y-%m-%d")
+                dt.date.fromisoformat(from_date)
                 self.settings["report_date_from"] = from_date
             
             if to_date:
-                dt.datetime.strptime(to_date, "%Y-%m-%d")
+                dt.date.fromisoformat(to_date)
                 self.settings["report_date_to"] = to_date
             
-            save_settings(self.settings)
-            
-            # Update scheduler if running
-            if self.scheduler_manager.is_running():
-                self.scheduler_manager.update_date_range(
-                    self.date_from_var.get().strip() or None,
-                    self.date_to_var.get().strip() or None
-                )
+            self._maybe_save()
         except ValueError:
-            pass  # Invalid date format - could show a warning
+            return  # Invalid date format - could show a warning
+        
+        # Coalesce rapid edits into one scheduler update
+        if self._date_update_after is not None:
+            self.root.after_cancel(self._date_update_after)
+        self._date_update_after = self.root.after(
+            _DATE_UPDATE_DEBOUNCE_MS, self._apply_date_update
+        )
+    
+    def _apply_date_update(self) -> None:
+        """Push the current date range to the scheduler if it is running."""
+        self._date_update_after = None
+        if self.scheduler_manager.is_running():
+            self.scheduler_manager.update_date_range(
+                self.date_from_var.get().strip() or None,
+                self.date_to_var.get().strip() or None
+            )
+    
+    def _today(self) -> dt.date:
+        """Return today's date, re-reading the clock at most once a minute."""
+        if self._today_cache is None:
+            self._today_cache = dt.date.today()
+            self.root.after(_TODAY_CACHE_MS, self._invalidate_today)
+        return self._today_cache
+    
+    def _invalidate_today(self) -> None:
+        """Drop the cached date so the next _today() call re-reads it."""
+        self._today_cache = None
     
     def set_this_month(self) -> None:
         """Set date range to current month."""
-        today = dt.date.today()
+        today = self._today()
         first_day = today.replace(day=1)
-        self.date_from_var.set(first_day.strftime("%Y-%m-%d"))
-        self.date_to_var.set(today.strftime("%Y-%m-%d"))
+        self.date_from_var.set(first_day.isoformat())
+        self.date_to_var.set(today.isoformat())
         self.on_date_changed()
     
     def set_last_month(self) -> None:
         """Set date range to last month."""
-        today = dt.date.today()
+        today = self._today()
         first_day_this_month = today.replace(day=1)
         last_day_last_month = first_day_this_month - dt.timedelta(days=1)
         first_day_last_month = last_day_last_month.replace(day=1)
-        self.date_from_var.set(first_day_last_month.strftime("%Y-%m-%d"))
-        self.date_to_var.set(last_day_last_month.strftime("%Y-%m-%d"))
+        self.date_from_var.set(first_day_last_month.isoformat())
+        self.date_to_var.set(last_day_last_month.isoformat())
         self.on_date_changed()
     
     def set_this_year(self) -> None:
         """Set date range to current year."""
-        today = dt.date.today()
+        today = self._today()
         first_day_year = today.replace(month=1, day=1)
-        self.date_from_var.set(first_day_year.strftime("%Y-%m-%d"))
-        self.date_to_var.set(today.strftime("%Y-%m-%d"))
+        self.date_from_var.set(first_day_year.isoformat())
+        self.date_to_var.set(today.isoformat())
         self.on_date_changed()
     
     def set_last_year(self) -> None:
         """Set date range to last year."""
-        today = dt.date.today()
+        today = self._today()
         last_year = today.year - 1
         first_day_last_year = dt.date(last_year, 1, 1)
         last_day_last_year = dt.date(last_year, 12, 31)
-        self.date_from_var.set(first_day_last_year.strftime("%Y-%m-%d"))
-        self.date_to_var.set(last_day_last_year.strftime("%Y-%m-%d"))
+        self.date_from_var.set(first_day_last_year.isoformat())
+        self.date_to_var.set(last_day_last_year.isoformat())
         self.on_date_changed()
     
-    def start_timer_display(self) -> None:
-        """Start the timer display update loop."""
-        self.update_timer_display()
-        self.root.after(1000, self.start_timer_display)
+    def _set_if_changed(self, var: tk.StringVar, value: str) -> None:
+        """Set a Tk variable only when its value actually changes."""
+        key = id(var)
+        if self._var_values.get(key) != value:
+            self._var_values[key] = value
+            var.set(value)
+    
+    def _maybe_save(self) -> None:
+        """Persist settings only if they changed since the last save."""
+        if self.settings != self._settings_saved_snapshot:
+            save_settings(self.settings)
+            self._settings_saved_snapshot = dict(self.settings)
+    
+    def _post_ui(self, handler: Callable[..., None], *args: Any) -> None:
+        """Queue a UI update from any thread for the UI pump to apply."""
+        self._ui_queue.put((handler, args))
+    
+    def _drain_ui_queue(self) -> None:
+        """Apply all queued UI updates in one batch, then reschedule.
+        
+        A failing handler is logged and skipped; the pump always
+        reschedules so later updates are not lost.
+        """
+        try:
+            while True:
+                try:
+                    handler, args = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    handler(*args)
+                except Exception as e:
+                    name = getattr(handler, "__name__", repr(handler))
+                    log_error(f"UI update {name} failed: {e}", self.output_dir)
+        finally:
+            self._pump_after_id = self.root.after(
+                _UI_PUMP_INTERVAL_MS, self._drain_ui_queue
+            )
+    
+    def _tick(self) -> None:
+        """Refresh the timer display once per second while there is work."""
+        if self.last_export_time is not None or self.scheduler_manager.is_running():
+            self.update_timer_display()
+        self._tick_after_id = self.root.after(1000, self._tick)
     
     def update_timer_display(self) -> None:
         """Update the timer display."""
@@ -434,25 +528,30 @@ class QuickBooksAutoReporterGUI:
             else:
                 time_str = f"{seconds}s"
             
-            self.time_since_var.set(time_str)
+            self._set_if_changed(self.time_since_var, time_str)
         else:
-            self.time_since_var.set("-")
+            self._set_if_changed(self.time_since_var, "-")
         
         # Update next run time if scheduler is running
-        if self.scheduler_manager.is_running():
-            status = self.scheduler_manager.get_status()
-            if status and status.get("time_until_next_run"):
-                self.next_var.set(status["time_until_next_run"])
+        next_run = self.scheduler_manager.time_until_next_run()
+        if next_run:
+            self._set_if_changed(self.next_var, next_run)
     
     def open_folder(self) -> None:
         """Open output folder in explorer."""
         os.makedirs(self.output_dir, exist_ok=True)
         if sys.platform == "win32":
             os.startfile(self.output_dir)
-        elif sys.platform == "darwin":
-            subprocess.run(["open", self.output_dir])
         else:
-            subprocess.run(["xdg-open", self.output_dir])
+            # Fire and forget so the UI thread never waits on the launcher
+            opener = "open" if sys.platform == "darwin" else "xdg-open"
+            subprocess.Popen(
+                [opener, self.output_dir],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
     
     def start_scheduler(self) -> None:
         """Start scheduled exports."""
@@ -462,7 +561,7 @@ class QuickBooksAutoReporterGUI:
             self.date_from_var.get().strip() or None,
             self.date_to_var.get().strip() or None
         ):
-            self.status_var.set("Running")
+            self._set_if_changed(self.status_var, "Running")
             self.start_button.config(state="disabled")
             self.stop_button.config(state="normal")
             log_info("Started scheduled exports", self.output_dir)
@@ -470,59 +569,77 @@ class QuickBooksAutoReporterGUI:
     def stop_scheduler(self) -> None:
         """Stop scheduled exports."""
         if self.scheduler_manager.stop():
-            self.status_var.set("Stopped")
-            self.next_var.set("-")
+            self._set_if_changed(self.status_var, "Stopped")
+            self._set_if_changed(self.next_var, "-")
             self.start_button.config(state="normal")
             self.stop_button.config(state="disabled")
             log_info("Stopped scheduled exports", self.output_dir)
     
     def export_now(self) -> None:
         """Trigger immediate export."""
-        self.status_var.set("Exporting...")
+        if self._export_thread is not None and self._export_thread.is_alive():
+            return  # An export is already in progress
+        
+        self._set_if_changed(self.status_var, "Exporting...")
         
         # Reset all report statuses
-        for report_key in REPORT_CONFIGS.keys():
-            self.report_status_vars[report_key]["status"].set("Working...")
-            self.report_status_vars[report_key]["rows"].set("-")
-            self.report_status_vars[report_key]["excel"].set("-")
+        working_line = _format_report_line("Working...", "-", "-")
+        for report_key, line_var in self.report_line_vars.items():
+            self._report_states[report_key][:] = ["Working...", "-", "-"]
+            self._set_if_changed(line_var, working_line)
+        
+        # Read Tk variables here; the worker thread must not touch Tk
+        date_from = self.date_from_var.get().strip() or None
+        date_to = self.date_to_var.get().strip() or None
         
         # Run export in background thread
-        threading.Thread(
+        self.export_button.config(state="disabled")
+        self._export_thread = threading.Thread(
             target=self._export_worker,
+            args=(date_from, date_to),
             daemon=True
-        ).start()
+        )
+        self._export_thread.start()
     
-    def _export_worker(self) -> None:
+    def _export_worker(
+        self, date_from: Optional[str], date_to: Optional[str]
+    ) -> None:
         """Background export worker."""
         try:
-            date_from = self.date_from_var.get().strip() or None
-            date_to = self.date_to_var.get().strip() or None
-            
             results, errors = export_all_reports(
                 self.output_dir, date_from, date_to, self.on_report_status
             )
             
             # Update UI from main thread
-            self.root.after(0, self._on_export_complete, results, errors)
+            self._post_ui(self._on_export_complete, results, errors)
             
         except Exception as e:
-            self.root.after(0, self._on_export_error, str(e))
+            self._post_ui(self._on_export_error, str(e))
     
     def on_report_status(self, report_key: str, status: str, details: str) -> None:
-        """Handle report status updates."""
-        if report_key in self.report_status_vars:
-            self.report_status_vars[report_key]["status"].set(status)
-            if status in ["Success", "Partial"]:
-                self.report_status_vars[report_key]["rows"].set(details)
-                self.report_status_vars[report_key]["excel"].set("✅")
-            elif status == "Error":
-                self.report_status_vars[report_key]["rows"].set("-")
-                self.report_status_vars[report_key]["excel"].set("❌")
+        """Handle report status updates (may be called from a worker thread)."""
+        self._post_ui(self._apply_report_status, report_key, status, details)
+    
+    def _apply_report_status(
+        self, report_key: str, status: str, details: str
+    ) -> None:
+        """Apply a report status update on the UI thread."""
+        state = self._report_states.get(report_key)
+        if state is None:
+            return
+        state[0] = status
+        if status in ("Success", "Partial"):
+            state[1:] = [details, "✅"]
+        elif status == "Error":
+            state[1:] = ["-", "❌"]
+        self._set_if_changed(
+            self.report_line_vars[report_key], _format_report_line(*state)
+        )
     
     def on_scheduler_status(self, component: str, status: str, message: str) -> None:
-        """Handle scheduler status updates."""
+        """Handle scheduler status updates (called from the scheduler thread)."""
         if component == "scheduler":
-            self.status_var.set(status)
+            self._post_ui(self._set_if_changed, self.status_var, status)
     
     def on_scheduler_error(self, component: str, error: Exception) -> None:
         """Handle scheduler errors."""
@@ -530,25 +647,35 @@ class QuickBooksAutoReporterGUI:
     
     def _on_export_complete(self, results: Dict[str, Any], errors: Dict[str, str]) -> None:
         """Handle export completion."""
+        self.export_button.config(state="normal")
         self.last_export_time = dt.datetime.now()
         self.last_export_results = results
         
         # Update overall status
         if errors:
-            self.status_var.set(f"Completed with {len(errors)} error(s)")
+            self._set_if_changed(
+                self.status_var, f"Completed with {len(errors)} error(s)"
+            )
         else:
-            self.status_var.set("All reports completed")
+            self._set_if_changed(self.status_var, "All reports completed")
     
     def _on_export_error(self, msg: str) -> None:
         """Handle export error."""
-        self.status_var.set("Error")
+        self.export_button.config(state="normal")
+        self._set_if_changed(self.status_var, "Error")
         messagebox.showerror("QuickBooks Autoreporter", msg)
     
     def on_exit(self) -> None:
         """Handle application exit."""
+        self.root.after_cancel(self._tick_after_id)
+        self.root.after_cancel(self._pump_after_id)
+        if self._date_update_after is not None:
+            self.root.after_cancel(self._date_update_after)
         self.stop_scheduler()
-        save_settings(self.settings)
-        self.root.destroy()
+        self._maybe_save()
+        # Leave mainloop only; run_gui's callers exit the process right
+        # after, so per-widget Tk teardown is skipped
+        self.root.quit()
     
     def run(self) -> None:
         """Start the GUI main loop."""
@@ -5,12 +5,15 @@ interface based on command-line arguments and execution context.
 """
 
 import sys
-import os
 
-# Add the src directory to Python path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if __package__:
+    from .cli import main as cli_main
+else:
+    # Run as a plain script: make the src directory importable first
+    import os
 
-from quickbooks_autoreport.cli import main as cli_main
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from quickbooks_autoreport.cli import main as cli_main
 
 
 def main() -> int:
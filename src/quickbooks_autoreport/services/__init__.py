@@ -1,50 +1,74 @@
 """Business logic and service layer for QuickBooks Auto Reporter."""
 
-from .qbxml_generator import (
-    build_report_qbxml,
-    build_salesorder_query,
-    validate_xml_structure,
-    generate_xml_with_version_fallback,
-    test_xml_generation,
-)
+import importlib
+from typing import Any
+
+# Public name -> submodule that defines it. Submodules are imported on
+# first attribute access (PEP 562) so that importing the package does not
+# pull in the COM/XML machinery until a service is actually used.
+_LAZY = {
+    # qbXML generation
+    "build_report_qbxml": "qbxml_generator",
+    "build_salesorder_query": "qbxml_generator",
+    "validate_xml_structure": "qbxml_generator",
+    "generate_xml_with_version_fallback": "qbxml_generator",
+    "test_xml_generation": "qbxml_generator",
+    
+    # Report parsing
+    "parse_report_rows": "report_parser",
+    "parse_salesorders_to_rows": "report_parser",
+    "handle_missing_columns": "report_parser",
+    "handle_empty_values": "report_parser",
+    "validate_parsed_data": "report_parser",
+    "parse_and_validate_response": "report_parser",
+    
+    # Export service
+    "render_csv": "export_service",
+    "write_csv_hashing": "export_service",
+    "write_csv_to_path": "export_service",
+    "export_to_csv": "export_service",
+    "export_to_excel": "export_service",
+    "handle_change_detection": "export_service",
+    "export_report_with_change_detection": "export_service",
+    
+    # Report service
+    "export_report": "report_service",
+    "export_all_reports": "report_service",
+    "validate_report_parameters": "report_service",
+    
+    # Diagnostics service
+    "check_quickbooks_installation": "diagnostics_service",
+    "check_sdk_installation": "diagnostics_service",
+    "test_com_object_creation": "diagnostics_service",
+    "test_quickbooks_connection": "diagnostics_service",
+    "diagnose_quickbooks_connection": "diagnostics_service",
+    "create_diagnostic_excel_report": "diagnostics_service",
+    "print_diagnostics_summary": "diagnostics_service",
+    
+    # Scheduler
+    "SchedulerThread": "scheduler",
+    "SchedulerManager": "scheduler",
+}
 
-from .report_parser import (
-    parse_report_rows,
-    parse_salesorders_to_rows,
-    handle_missing_columns,
-    handle_empty_values,
-    validate_parsed_data,
-    parse_and_validate_response,
-)
 
-from .export_service import (
-    render_csv,
-    export_to_csv,
-    export_to_excel,
-    handle_change_detection,
-    export_report_with_change_detection,
-)
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining ``name`` on first access."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
 
-from .report_service import (
-    export_report,
-    export_all_reports,
-    validate_report_parameters,
-)
 
-from .diagnostics_service import (
-    check_quickbooks_installation,
-    check_sdk_installation,
-    test_com_object_creation,
-    test_quickbooks_connection,
-    diagnose_quickbooks_connection,
-    create_diagnostic_excel_report,
-    print_diagnostics_summary,
-)
+def __dir__():
+    """Include the lazily imported names in ``dir()``."""
+    return sorted(set(globals()) | set(_LAZY))
 
-from .scheduler import (
-    SchedulerThread,
-    SchedulerManager,
-)
 
 __all__ = [
     # qbXML generation
@@ -64,6 +88,8 @@ __all__ = [
     
     # Export service
     "render_csv",
+    "write_csv_hashing",
+    "write_csv_to_path",
     "export_to_csv",
     "export_to_excel",
     "handle_change_detection",
@@ -1,6 +1,7 @@
 """CSV creation service for QuickBooks Auto Reporter."""
 
 import csv
+import io
 import logging
 from typing import List
 
@@ -29,9 +30,8 @@ class CSVCreator:
             rows: Data rows
         """
         self._logger.debug(f"Creating CSV: {path}")
-        output = []
-        writer = csv.writer(output)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
         writer.writerow(headers)
         writer.writerows(rows)
-        content = "\n".join(output)
-        self._file.write_file(path, content)
\ No newline at end of file
+        self._file.write_file(path, buffer.getvalue())
@@ -8,7 +8,14 @@ import json
 import os
 import sys
 import datetime as dt
-from typing import Dict, Any, Tuple
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    import openpyxl
+    from openpyxl.styles import Font, PatternFill
+except ImportError:
+    openpyxl = None
 
 from ..adapters.quickbooks.connection import initialize_com, open_connection, try_begin_session, cleanup_com
 from ..adapters.quickbooks.error_handler import get_user_friendly_error
@@ -16,6 +23,86 @@ from ..config import DEFAULT_OUT_DIR
 from ..utils.logging_utils import log_diagnostic, log_info, log_success, log_error, log_separator
 
 
+# Registry locations that hold one subkey per installed QuickBooks version
+_QB_REGISTRY_KEYS = (
+    r"SOFTWARE\Intuit\QuickBooks",
+    r"SOFTWARE\WOW6432Node\Intuit\QuickBooks",
+)
+
+# On-disk copy of the last registry scan, trusted while it is newer than
+# the SOFTWARE hive that backs HKEY_LOCAL_MACHINE\SOFTWARE
+_INSTALL_CACHE_FILE = os.path.join(DEFAULT_OUT_DIR, ".qb_install_cache.json")
+_REGISTRY_HIVE = os.path.join(
+    os.environ.get("SystemRoot", r"C:\Windows"), "System32", "config", "SOFTWARE"
+)
+
+
+def _scan_registry() -> List[str]:
+    """Walk the QuickBooks registry keys for installed versions.
+    
+    Returns:
+        Registry paths of the QuickBooks version subkeys found
+        
+    Raises:
+        ImportError: If winreg is unavailable (non-Windows)
+    """
+    import winreg  # type: ignore
+    
+    qb_paths = []
+    for key_path in _QB_REGISTRY_KEYS:
+        try:
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, key_path) as key:
+                i = 0
+                while True:
+                    try:
+                        subkey_name = winreg.EnumKey(key, i)
+                        if subkey_name.startswith(('QB', 'QuickBooks')):
+                            qb_paths.append(f"{key_path}\\{subkey_name}")
+                        i += 1
+                    except WindowsError:
+                        break
+        except FileNotFoundError:
+            continue
+    return qb_paths
+
+
+def _load_install_cache() -> Optional[List[str]]:
+    """Return cached registry scan results if still newer than the hive."""
+    try:
+        if os.path.getmtime(_INSTALL_CACHE_FILE) <= os.path.getmtime(_REGISTRY_HIVE):
+            return None
+        with open(_INSTALL_CACHE_FILE, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return cached if isinstance(cached, list) else None
+
+
+def _save_install_cache(qb_paths: List[str]) -> None:
+    """Atomically persist registry scan results; failures are ignored."""
+    tmp_file = f"{_INSTALL_CACHE_FILE}.tmp"
+    try:
+        os.makedirs(os.path.dirname(_INSTALL_CACHE_FILE), exist_ok=True)
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(qb_paths, f)
+        os.replace(tmp_file, _INSTALL_CACHE_FILE)
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=1)
+def _installed_qb_paths() -> Tuple[str, ...]:
+    """Registry paths of installed QuickBooks versions, read once per process.
+    
+    Scan failures raise and are therefore not cached.
+    """
+    qb_paths = _load_install_cache()
+    if qb_paths is None:
+        qb_paths = _scan_registry()
+        _save_install_cache(qb_paths)
+    return tuple(qb_paths)
+
+
 def check_quickbooks_installation() -> Tuple[bool, list]:
     """Check if QuickBooks Desktop is installed on the system.
     
@@ -23,35 +110,30 @@ def check_quickbooks_installation() -> Tuple[bool, list]:
         Tuple of (is_installed, details_list)
     """
     try:
-        import winreg  # type: ignore
-        
-        # Check for QuickBooks in registry
-        qb_paths = []
-        registry_keys = [
-            r"SOFTWARE\Intuit\QuickBooks",
-            r"SOFTWARE\WOW6432Node\Intuit\QuickBooks",
-        ]
-        
-        for key_path in registry_keys:
-            try:
-                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, key_path) as key:
-                    i = 0
-                    while True:
-                        try:
-                            subkey_name = winreg.EnumKey(key, i)
-                            if subkey_name.startswith(('QB', 'QuickBooks')):
-                                qb_paths.append(f"{key_path}\\{subkey_name}")
-                            i += 1
-                        except WindowsError:
-                            break
-            except FileNotFoundError:
-                continue
-        
+        qb_paths = list(_installed_qb_paths())
         return len(qb_paths) > 0, qb_paths
     except Exception as e:
         return False, [f"Registry check failed: {e}"]
 
 
+@lru_cache(maxsize=1)
+def _sdk_clsid() -> str:
+    """Look up the QBXMLRP2 CLSID once; lookup errors are not cached.
+    
+    Raises:
+        pythoncom.com_error: If the request processor is not registered
+    """
+    import pythoncom  # type: ignore
+    
+    # Try to create the COM object without initializing
+    pythoncom.CoInitialize()
+    try:
+        # Check if QBXMLRP2.RequestProcessor is registered
+        return str(pythoncom.CLSIDFromProgID("QBXMLRP2.RequestProcessor"))
+    finally:
+        pythoncom.CoUninitialize()
+
+
 def check_sdk_installation() -> Tuple[bool, str]:
     """Check if QuickBooks SDK is properly installed and registered.
     
@@ -61,16 +143,10 @@ def check_sdk_installation() -> Tuple[bool, str]:
     try:
         import pythoncom  # type: ignore
         
-        # Try to create the COM object without initializing
-        pythoncom.CoInitialize()
         try:
-            # Check if QBXMLRP2.RequestProcessor is registered
-            clsid = pythoncom.CLSIDFromProgID("QBXMLRP2.RequestProcessor")
-            return True, f"SDK found with CLSID: {clsid}"
+            return True, f"SDK found with CLSID: {_sdk_clsid()}"
         except pythoncom.com_error as e:
             return False, f"COM registration error: {e}"
-        finally:
-            pythoncom.CoUninitialize()
     except Exception as e:
         return False, f"SDK check failed: {e}"
 
@@ -95,6 +171,17 @@ def test_quickbooks_connection() -> Tuple[bool, str]:
     Returns:
         Tuple of (success, message)
     """
+    success, message, _ = _run_connection_test()
+    return success, message
+
+
+def _run_connection_test() -> Tuple[bool, str, Optional[Dict[str, Any]]]:
+    """Test connection to QuickBooks, keeping the failure details.
+    
+    Returns:
+        Tuple of (success, message, error_info); error_info is the
+        get_user_friendly_error() result on failure, otherwise None
+    """
     rp = None
     try:
         rp = initialize_com()
@@ -107,10 +194,10 @@ def test_quickbooks_connection() -> Tuple[bool, str]:
         except Exception:
             pass
         
-        return True, f"Connection successful. Company: {info.get('CompanyFileName', 'Unknown')}"
+        return True, f"Connection successful. Company: {info.get('CompanyFileName', 'Unknown')}", None
     except Exception as e:
         error_info = get_user_friendly_error(e)
-        return False, f"Connection failed: {error_info['message']}"
+        return False, f"Connection failed: {error_info['message']}", error_info
     finally:
         cleanup_com(rp)
 
@@ -177,25 +264,16 @@ def diagnose_quickbooks_connection(out_dir: str = None) -> Dict[str, Any]:
     
     if com_success:
         log_diagnostic("Testing QuickBooks connection...", out_dir)
-        conn_success, conn_msg = test_quickbooks_connection()
+        conn_success, conn_msg, conn_error = _run_connection_test()
         diagnostics["connectivity_test"]["connection_test"] = {
             "success": conn_success,
             "message": conn_msg,
             "status": "✅ Success" if conn_success else "❌ Failed"
         }
         
-        if not conn_success:
-            # Add error details
-            try:
-                rp = initialize_com()
-                try:
-                    open_connection(rp)
-                    try_begin_session(rp)
-                except Exception as conn_e:
-                    error_info = get_user_friendly_error(conn_e)
-                    diagnostics["connectivity_test"]["connection_error"] = error_info
-            finally:
-                cleanup_com(rp)
+        if conn_error is not None:
+            # Add error details from the failed attempt
+            diagnostics["connectivity_test"]["connection_error"] = conn_error
     
     # Generate recommendations
     if not qb_installed:
@@ -229,6 +307,12 @@ def diagnose_quickbooks_connection(out_dir: str = None) -> Dict[str, Any]:
     return diagnostics
 
 
+if openpyxl is not None:
+    # Title cell styling for the diagnostic workbook
+    _TITLE_FONT = Font(bold=True, color="FFFFFF", size=14)
+    _TITLE_FILL = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+
+
 def create_diagnostic_excel_report(diagnostics: Dict[str, Any], out_dir: str) -> None:
     """Create an Excel diagnostic report.
     
@@ -276,44 +360,36 @@ def create_diagnostic_excel_report(diagnostics: Dict[str, Any], out_dir: str) ->
                 summary_data.append([f"{i}.", rec])
         
         # Try to create Excel file with openpyxl
+        if openpyxl is None:
+            log_error("openpyxl not available for Excel diagnostic report", out_dir)
+            return
+        
         try:
-            import openpyxl
-            from openpyxl.styles import Alignment, Font, PatternFill
-            
             wb = openpyxl.Workbook()
             ws = wb.active
             ws.title = "Diagnostic Report"
             
-            # Write data with basic formatting
+            # Write data with basic formatting, tracking column widths
+            col_widths = [0, 0]
             for row_idx, (col1, col2) in enumerate(summary_data, 1):
                 ws.cell(row=row_idx, column=1, value=col1)
                 ws.cell(row=row_idx, column=2, value=col2)
+                col_widths[0] = max(col_widths[0], len(str(col1)))
+                col_widths[1] = max(col_widths[1], len(str(col2)))
                 
                 # Format header
                 if row_idx == 1:
                     cell = ws.cell(row=row_idx, column=1)
-                    cell.font = Font(bold=True, size=14)
-                    cell.fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-                    cell.font = Font(bold=True, color="FFFFFF", size=14)
+                    cell.fill = _TITLE_FILL
+                    cell.font = _TITLE_FONT
             
             # Auto-adjust column widths
-            for column in ws.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                ws.column_dimensions[column_letter].width = adjusted_width
+            for column_letter, max_length in zip("AB", col_widths):
+                ws.column_dimensions[column_letter].width = min(max_length + 2, 50)
             
             wb.save(excel_path)
             log_success(f"Excel diagnostic report created: {os.path.basename(excel_path)}", out_dir)
             
-        except ImportError:
-            log_error("openpyxl not available for Excel diagnostic report", out_dir)
         except Exception as excel_error:
             log_error(f"Excel diagnostic report creation failed: {excel_error}", out_dir)
     
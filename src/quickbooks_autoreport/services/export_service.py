@@ -8,13 +8,57 @@ import datetime as dt
 import json
 import os
 from io import StringIO
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional
+
+try:
+    import openpyxl
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import (
+        Alignment, Border, Font, NamedStyle, PatternFill, Side
+    )
+    from openpyxl.styles.fonts import DEFAULT_FONT
+    from openpyxl.utils import get_column_letter
+except ImportError:
+    openpyxl = None
 
 from ..config import REPORT_CONFIGS, get_file_paths
-from ..utils.file_utils import compute_data_hash, should_create_snapshot, save_hash, create_snapshot
+from ..utils.file_utils import (
+    DataHasher,
+    compute_data_hash,
+    should_create_snapshot,
+    save_hash,
+    create_snapshot,
+    copy_snapshot,
+)
 from ..utils.logging_utils import log_success, log_error, log_data
 
 
+# Per-report display names and worksheet titles (Excel sheet name limit
+# is 31 characters), derived once from the static report configuration
+_REPORT_NAMES = {k: v["name"] for k, v in REPORT_CONFIGS.items()}
+_SHEET_TITLES = {k: name[:31] for k, name in _REPORT_NAMES.items()}
+
+
+if openpyxl is not None:
+    # Invariant style components shared by every exported workbook
+    _THIN_SIDE = Side(style="thin")
+    _THIN_BORDER = Border(
+        left=_THIN_SIDE, right=_THIN_SIDE, top=_THIN_SIDE, bottom=_THIN_SIDE
+    )
+    _HEADER_FONT = Font(bold=True, color="FFFFFF", size=12)
+    _HEADER_FILL = PatternFill(
+        start_color="4472C4", end_color="4472C4", fill_type="solid"
+    )
+    _HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="center")
+    # Alternating row colors: even sheet rows grey, odd rows white
+    _ROW_EVEN_FILL = PatternFill(
+        start_color="F2F2F2", end_color="F2F2F2", fill_type="solid"
+    )
+    _ROW_ODD_FILL = PatternFill(
+        start_color="FFFFFF", end_color="FFFFFF", fill_type="solid"
+    )
+
+
 def render_csv(headers: List[str], rows: List[List[str]]) -> str:
     """Render data as CSV string.
     
@@ -26,13 +70,74 @@ def render_csv(headers: List[str], rows: List[List[str]]) -> str:
         CSV content as string
     """
     sio = StringIO()
-    w = csv.writer(sio, lineterminator="\n")
-    w.writerow(headers)
-    for r in rows:
-        w.writerow([c if c is not None else "" for c in r])
+    _write_csv_rows(sio, headers, rows)
     return sio.getvalue()
 
 
+def _write_csv_rows(f, headers: List[str], rows: List[List[str]]) -> None:
+    """Write headers and rows as CSV to a text stream.
+    
+    csv.writer already serializes None as an empty field, so rows go
+    straight to its C-level writerows without a per-cell substitution.
+    
+    Args:
+        f: Writable text stream
+        headers: List of column headers
+        rows: List of data rows
+    """
+    w = csv.writer(f, lineterminator="\n")
+    w.writerow(headers)
+    w.writerows(rows)
+
+
+def write_csv_to_path(path: str, headers: List[str], rows: List[List[str]]) -> None:
+    """Write data as a CSV file without building the content in memory.
+    
+    Args:
+        path: Output CSV file path
+        headers: List of column headers
+        rows: List of data rows
+    """
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        _write_csv_rows(f, headers, rows)
+
+
+class _HashingWriter:
+    """File-like writer that hashes text as it writes it through.
+    
+    The digest matches compute_data_hash() of the same text, so it can
+    be compared with hashes stored by earlier runs.
+    """
+    
+    def __init__(self, f) -> None:
+        self._f = f
+        self._hash = DataHasher()
+    
+    def write(self, s: str) -> int:
+        self._hash.update(s)
+        return self._f.write(s)
+    
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+
+def write_csv_hashing(path: str, headers: List[str], rows: List[List[str]]) -> str:
+    """Write data as a CSV file and hash it in the same pass.
+    
+    Args:
+        path: Output CSV file path
+        headers: List of column headers
+        rows: List of data rows
+        
+    Returns:
+        Hash of the CSV content, as compute_data_hash() would give
+    """
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = _HashingWriter(f)
+        _write_csv_rows(writer, headers, rows)
+    return writer.hexdigest()
+
+
 def export_to_csv(headers: List[str], rows: List[List[str]], out_dir: str, report_key: str) -> bool:
     """Export data to CSV file.
     
@@ -49,10 +154,7 @@ def export_to_csv(headers: List[str], rows: List[List[str]], out_dir: str, repor
         file_paths = get_file_paths(out_dir, report_key)
         csv_path = file_paths["main_csv"]
         
-        csv_content = render_csv(headers, rows)
-        
-        with open(csv_path, "w", newline="", encoding="utf-8") as f:
-            f.write(csv_content)
+        write_csv_to_path(csv_path, headers, rows)
         
         log_success(f"CSV file created: {os.path.basename(csv_path)}", out_dir)
         return True
@@ -122,82 +224,58 @@ def _create_excel_with_openpyxl(headers: List[str], rows: List[List[str]], excel
     Returns:
         True if successful, False otherwise
     """
+    if openpyxl is None:
+        log_error(f"Excel creation failed: openpyxl not available for {report_key}", out_dir)
+        return False
+
+    wb = None
     try:
-        import openpyxl
-        from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
-        from openpyxl.utils import get_column_letter
-
-        # Create workbook and worksheet
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = REPORT_CONFIGS[report_key]["name"][:31]  # Excel sheet name limit
-
-        # Enhanced styling
-        header_font = Font(bold=True, color="FFFFFF", size=12)
-        header_fill = PatternFill(
-            start_color="4472C4", end_color="4472C4", fill_type="solid"
+        # Enhanced styling, registered once per workbook as named styles so
+        # cells reference them instead of carrying their own style objects
+        header_style = NamedStyle(
+            name="qb_header",
+            font=_HEADER_FONT,
+            fill=_HEADER_FILL,
+            alignment=_HEADER_ALIGNMENT,
+            border=_THIN_BORDER,
         )
-        header_alignment = Alignment(horizontal="center", vertical="center")
-
-        # Border styles
-        thin_border = Border(
-            left=Side(style="thin"),
-            right=Side(style="thin"),
-            top=Side(style="thin"),
-            bottom=Side(style="thin"),
+        row_even_style = NamedStyle(
+            name="qb_row_even",
+            font=DEFAULT_FONT,
+            fill=_ROW_EVEN_FILL,
+            border=_THIN_BORDER,
         )
-
-        # Write headers with styling
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=str(header))
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_alignment
-            cell.border = thin_border
-
-        # Write data rows with alternating colors
-        data_fill_1 = PatternFill(
-            start_color="F2F2F2", end_color="F2F2F2", fill_type="solid"
-        )
-        data_fill_2 = PatternFill(
-            start_color="FFFFFF", end_color="FFFFFF", fill_type="solid"
+        row_odd_style = NamedStyle(
+            name="qb_row_odd",
+            font=DEFAULT_FONT,
+            fill=_ROW_ODD_FILL,
+            border=_THIN_BORDER,
         )
 
-        for row_idx, row_data in enumerate(rows, 2):
-            fill = data_fill_1 if row_idx % 2 == 0 else data_fill_2
-            for col_idx, value in enumerate(row_data, 1):
-                cell = ws.cell(
-                    row=row_idx,
-                    column=col_idx,
-                    value=str(value) if value is not None else "",
-                )
-                cell.fill = fill
-                cell.border = thin_border
-
-                # Format numbers if they look like currency or numbers
-                if isinstance(value, (int, float)):
-                    cell.number_format = (
-                        "#,##0.00" if isinstance(value, float) else "#,##0"
-                    )
-
-        # Auto-adjust column widths with better logic
-        for col_idx, column in enumerate(ws.columns, 1):
-            max_length = 0
-            column_letter = get_column_letter(col_idx)
+        # Column widths must be known before streaming rows in write-only
+        # mode, so measure the raw values up front
+        col_widths = [len(str(header)) for header in headers]
+        for row_data in rows:
+            for col_idx, value in enumerate(row_data):
+                if value is None:
+                    continue
+                length = len(str(value))
+                if col_idx >= len(col_widths):
+                    col_widths.append(length)
+                elif length > col_widths[col_idx]:
+                    col_widths[col_idx] = length
 
-            for cell in column:
-                try:
-                    cell_value = (
-                        str(cell.value) if cell.value is not None else ""
-                    )
-                    if len(cell_value) > max_length:
-                        max_length = len(cell_value)
-                except Exception:
-                    pass
+        # Create a streaming workbook and worksheet
+        wb = openpyxl.Workbook(write_only=True)
+        for style in (header_style, row_even_style, row_odd_style):
+            wb.add_named_style(style)
+        ws = wb.create_sheet(title=_SHEET_TITLES[report_key])
 
-            # Set width with reasonable limits
-            adjusted_width = min(max(max_length + 2, 10), 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
+        # Set width with reasonable limits
+        for col_idx, max_length in enumerate(col_widths, 1):
+            ws.column_dimensions[get_column_letter(col_idx)].width = min(
+                max(max_length + 2, 10), 50
+            )
 
         # Freeze the header row
         ws.freeze_panes = "A2"
@@ -208,19 +286,60 @@ def _create_excel_with_openpyxl(headers: List[str], rows: List[List[str]], excel
                 f"A1:{get_column_letter(len(headers))}{len(rows) + 1}"
             )
 
+        # Write headers with styling
+        header_cells = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=str(header))
+            cell.style = "qb_header"
+            header_cells.append(cell)
+        ws.append(header_cells)
+
+        # Write data rows with alternating colors
+        for row_idx, row_data in enumerate(rows, 2):
+            style_name = "qb_row_even" if row_idx % 2 == 0 else "qb_row_odd"
+            row_cells = []
+            for value in row_data:
+                cell = WriteOnlyCell(
+                    ws, value=str(value) if value is not None else ""
+                )
+                cell.style = style_name
+
+                # Format numbers if they look like currency or numbers
+                if isinstance(value, (int, float)):
+                    cell.number_format = (
+                        "#,##0.00" if isinstance(value, float) else "#,##0"
+                    )
+                row_cells.append(cell)
+            ws.append(row_cells)
+
         # Save the workbook
         wb.save(excel_path)
         log_success(f"Excel file created with openpyxl: {os.path.basename(excel_path)}", out_dir)
         return True
 
-    except ImportError as ie:
-        log_error(f"Excel creation failed: openpyxl not available for {report_key}. Error: {ie}", out_dir)
-        return False
     except Exception as excel_error:
         log_error(f"Excel creation error for {report_key}: {excel_error}", out_dir)
+        if wb is not None:
+            _discard_workbook(wb)
         return False
 
 
+def _discard_workbook(wb) -> None:
+    """Close the worksheet streams of a write-only workbook that failed.
+    
+    Left open, the pending row writers are only finalized at garbage
+    collection, where they fail noisily on their already-closed files.
+    
+    Args:
+        wb: Write-only workbook whose export was abandoned
+    """
+    for ws in wb.worksheets:
+        try:
+            ws.close()
+        except Exception:
+            pass
+
+
 def handle_change_detection(csv_content: str, out_dir: str, report_key: str) -> Dict[str, Any]:
     """Handle change detection and snapshot creation.
     
@@ -232,7 +351,31 @@ def handle_change_detection(csv_content: str, out_dir: str, report_key: str) ->
     Returns:
         Dictionary with change detection results
     """
-    new_hash = compute_data_hash(csv_content)
+    return _record_change(
+        compute_data_hash(csv_content),
+        out_dir,
+        report_key,
+        lambda: create_snapshot(out_dir, report_key, csv_content),
+    )
+
+
+def _record_change(
+    new_hash: str,
+    out_dir: str,
+    report_key: str,
+    make_snapshot: Callable[[], str],
+) -> Dict[str, Any]:
+    """Compare a data hash with the stored one and snapshot on change.
+    
+    Args:
+        new_hash: Hash of the freshly exported data
+        out_dir: Output directory path
+        report_key: Report configuration key
+        make_snapshot: Creates the snapshot and returns its path ("" on failure)
+        
+    Returns:
+        Dictionary with change detection results
+    """
     changed = should_create_snapshot(out_dir, report_key, new_hash)
     
     result = {
@@ -243,7 +386,7 @@ def handle_change_detection(csv_content: str, out_dir: str, report_key: str) ->
     }
     
     if changed:
-        snapshot_path = create_snapshot(out_dir, report_key, csv_content)
+        snapshot_path = make_snapshot()
         if snapshot_path:
             save_hash(out_dir, report_key, new_hash)
             result["snapshot_created"] = True
@@ -253,6 +396,27 @@ def handle_change_detection(csv_content: str, out_dir: str, report_key: str) ->
     return result
 
 
+def _excel_is_current(file_paths: Dict[str, str]) -> bool:
+    """Check whether the workbook reflects the stored data hash.
+    
+    A workbook rebuild can fail after the new hash was saved (e.g. while
+    the file is open in Excel), so the workbook only counts as current
+    when it was written no earlier than the hash file.
+    
+    Args:
+        file_paths: Report file paths from get_file_paths
+        
+    Returns:
+        True if the existing workbook can be kept, False otherwise
+    """
+    try:
+        excel_mtime = os.stat(file_paths["excel_file"]).st_mtime_ns
+        hash_mtime = os.stat(file_paths["hash_file"]).st_mtime_ns
+    except OSError:
+        return False
+    return excel_mtime >= hash_mtime
+
+
 def export_report_with_change_detection(
     headers: List[str],
     rows: List[List[str]],
@@ -279,26 +443,32 @@ def export_report_with_change_detection(
         "changed": False,
         "snapshot_created": False,
         "timestamp": dt.datetime.now(),
-        "report_name": REPORT_CONFIGS[report_key]["name"]
+        "report_name": _REPORT_NAMES[report_key]
     }
     
     try:
-        # Generate CSV content
-        csv_content = render_csv(headers, rows)
-        
-        # Handle change detection
-        change_result = handle_change_detection(csv_content, out_dir, report_key)
-        result.update(change_result)
-        
-        # Always write the main CSV file
+        # Always write the main CSV file, hashing it on the way out
         file_paths = get_file_paths(out_dir, report_key)
-        with open(file_paths["main_csv"], "w", newline="", encoding="utf-8") as f:
-            f.write(csv_content)
+        main_csv = file_paths["main_csv"]
+        new_hash = write_csv_hashing(main_csv, headers, rows)
         result["csv_created"] = True
         
-        # Create Excel file if requested
+        # Handle change detection; snapshots copy the file just written
+        change_result = _record_change(
+            new_hash,
+            out_dir,
+            report_key,
+            lambda: copy_snapshot(out_dir, report_key, main_csv),
+        )
+        result.update(change_result)
+        
+        # Create Excel file if requested; unchanged data keeps the
+        # existing workbook when it was built after the stored hash
         if create_excel:
-            result["excel_created"] = export_to_excel(headers, rows, out_dir, report_key)
+            if result["changed"] or not _excel_is_current(file_paths):
+                result["excel_created"] = export_to_excel(headers, rows, out_dir, report_key)
+            else:
+                result["excel_created"] = True
         
         # Log result
         if result["changed"]:
@@ -3,6 +3,7 @@
 Provides mock business insights for reports.
 """
 
+import datetime as dt
 import logging
 from typing import Dict, List, Optional
 
@@ -38,9 +39,7 @@ class InsightsGenerator:
         insights = {
             "row_count": len(rows),
             "column_count": len(headers),
-            "generated_at": logging.Formatter().formatTime(
-                logging.LogRecord("", 0, "", (), (), "", "")
-            ),
+            "generated_at": dt.datetime.now().isoformat(),
         }
 
         # Add report-specific mock insights
@@ -49,6 +49,9 @@ class SchedulerThread(threading.Thread):
         self._running = False
         self._last_run_time = None
         self._next_run_time = None
+        # (whole seconds remaining, formatted text) from the last call to
+        # _get_time_until_next_run, reused while the countdown is unchanged
+        self._next_run_label = (None, None)
         self._run_count = 0
         self._error_count = 0
         
@@ -171,16 +174,29 @@ class SchedulerThread(threading.Thread):
         
         delta = self._next_run_time - now
         total_seconds = int(delta.total_seconds())
+        cached_seconds, cached_text = self._next_run_label
+        if total_seconds == cached_seconds:
+            return cached_text
         
         hours, remainder = divmod(total_seconds, 3600)
         minutes, seconds = divmod(remainder, 60)
         
         if hours > 0:
-            return f"{hours}h {minutes}m {seconds}s"
+            text = f"{hours}h {minutes}m {seconds}s"
         elif minutes > 0:
-            return f"{minutes}m {seconds}s"
+            text = f"{minutes}m {seconds}s"
         else:
-            return f"{seconds}s"
+            text = f"{seconds}s"
+        self._next_run_label = (total_seconds, text)
+        return text
+    
+    def time_until_next_run(self) -> Optional[str]:
+        """Get time until next run without building the full status dict.
+        
+        Returns:
+            Human-readable time until next run or None if not scheduled
+        """
+        return self._get_time_until_next_run()
     
     def update_interval(self, new_interval: str) -> None:
         """Update the polling interval.
@@ -298,6 +314,17 @@ class SchedulerManager:
         
         return self._scheduler.get_status()
     
+    def time_until_next_run(self) -> Optional[str]:
+        """Get time until the next scheduled run.
+        
+        Returns:
+            Human-readable time until next run, or None if not running
+        """
+        if not self._scheduler or not self._scheduler.is_running():
+            return None
+        
+        return self._scheduler.time_until_next_run()
+    
     def update_interval(self, new_interval: str) -> bool:
         """Update the polling interval.
         
@@ -7,6 +7,7 @@ from .file_utils import (
     should_create_snapshot,
     save_hash,
     create_snapshot,
+    copy_snapshot,
     ensure_directory_exists,
 )
 
@@ -34,6 +35,7 @@ __all__ = [
     "should_create_snapshot",
     "save_hash",
     "create_snapshot",
+    "copy_snapshot",
     "ensure_directory_exists",
     
     # Logging utilities
@@ -3,11 +3,22 @@
 import datetime as dt
 import hashlib
 import os
+import shutil
 from typing import Dict, Any
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 from ..config import get_file_paths
 
 
+# Last hash written or read per hash file, so polling cycles compare
+# against memory instead of re-reading the file
+_hash_cache: Dict[str, str] = {}
+
+
 def sha256_text(s: str) -> str:
     """Generate SHA-256 hash of text string.
     
@@ -36,6 +47,37 @@ def snapshot_filename(out_dir: str, report_key: str) -> str:
     return f"{base}_{ts}{ext}"
 
 
+# Prefix marking XXH3 data hashes, so stored SHA-256 hashes from older
+# versions simply compare unequal (one re-snapshot) instead of colliding
+XXH3_HASH_PREFIX = "xxh3:"
+
+
+class DataHasher:
+    """Incremental change-detection hash over text.
+    
+    Uses XXH3-128 when the optional xxhash package is installed, since
+    change detection needs no cryptographic strength, and SHA-256
+    otherwise. Feeding text in pieces yields the same digest as
+    compute_data_hash() over the concatenated text.
+    """
+    
+    def __init__(self) -> None:
+        if xxhash is not None:
+            self._hash = xxhash.xxh3_128()
+            self._prefix = XXH3_HASH_PREFIX
+        else:
+            self._hash = hashlib.sha256()
+            self._prefix = ""
+    
+    def update(self, text: str) -> None:
+        """Add text to the hash."""
+        self._hash.update(text.encode("utf-8", "ignore"))
+    
+    def hexdigest(self) -> str:
+        """Return the (prefixed) hex digest of the text seen so far."""
+        return self._prefix + self._hash.hexdigest()
+
+
 def compute_data_hash(csv_text: str) -> str:
     """Compute hash of CSV data for change detection.
     
@@ -43,9 +85,14 @@ def compute_data_hash(csv_text: str) -> str:
         csv_text: CSV content as string
         
     Returns:
-        SHA-256 hash of the data
+        "xxh3:"-prefixed XXH3-128 hash if xxhash is installed, otherwise
+        the SHA-256 hash of the data
     """
-    return sha256_text(csv_text)
+    if xxhash is None:
+        return sha256_text(csv_text)
+    return XXH3_HASH_PREFIX + xxhash.xxh3_128_hexdigest(
+        csv_text.encode("utf-8", "ignore")
+    )
 
 
 def should_create_snapshot(out_dir: str, report_key: str, new_hash: str) -> bool:
@@ -63,11 +110,17 @@ def should_create_snapshot(out_dir: str, report_key: str, new_hash: str) -> bool
     hash_file = file_paths["hash_file"]
     
     if not os.path.exists(hash_file):
+        _hash_cache.pop(hash_file, None)
         return True
     
+    stored_hash = _hash_cache.get(hash_file)
+    if stored_hash is not None:
+        return stored_hash != new_hash
+    
     try:
         with open(hash_file, "r", encoding="utf-8") as f:
             stored_hash = f.read().strip()
+        _hash_cache[hash_file] = stored_hash
         return stored_hash != new_hash
     except Exception:
         return True
@@ -87,8 +140,9 @@ def save_hash(out_dir: str, report_key: str, hash_value: str) -> None:
     try:
         with open(hash_file, "w", encoding="utf-8") as f:
             f.write(hash_value)
+        _hash_cache[hash_file] = hash_value
     except Exception:
-        pass
+        _hash_cache.pop(hash_file, None)
 
 
 def create_snapshot(out_dir: str, report_key: str, csv_content: str) -> str:
@@ -112,6 +166,26 @@ def create_snapshot(out_dir: str, report_key: str, csv_content: str) -> str:
         return ""
 
 
+def copy_snapshot(out_dir: str, report_key: str, source_path: str) -> str:
+    """Create timestamped snapshot file by copying an existing CSV file.
+    
+    Args:
+        out_dir: Output directory path
+        report_key: Report configuration key
+        source_path: Path of the CSV file to snapshot
+        
+    Returns:
+        Path to created snapshot file, or "" on failure
+    """
+    snapshot_path = snapshot_filename(out_dir, report_key)
+    
+    try:
+        shutil.copyfile(source_path, snapshot_path)
+        return snapshot_path
+    except Exception:
+        return ""
+
+
 def ensure_directory_exists(path: str) -> None:
     """Ensure directory exists, create if it doesn't.
     
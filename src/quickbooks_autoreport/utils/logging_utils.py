@@ -11,6 +11,10 @@ from ..config import DEFAULT_OUT_DIR
 # Thread-safe logging
 _log_lock = threading.Lock()
 
+# Output directories already created by log(), so repeated calls skip the
+# makedirs syscall
+_ensured_dirs = set()
+
 
 def log(msg: str, out_dir: Optional[str] = None) -> None:
     """Log message to file with timestamp and emoji indicators.
@@ -25,10 +29,12 @@ def log(msg: str, out_dir: Optional[str] = None) -> None:
     ts = dt.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
     # Ensure directory exists
-    try:
-        os.makedirs(out_dir, exist_ok=True)
-    except Exception:
-        return
+    if out_dir not in _ensured_dirs:
+        try:
+            os.makedirs(out_dir, exist_ok=True)
+        except Exception:
+            return
+        _ensured_dirs.add(out_dir)
     
     log_file = os.path.join(out_dir, "QuickBooks_Auto_Reports.log")
     
@@ -38,7 +44,8 @@ def log(msg: str, out_dir: Optional[str] = None) -> None:
             with open(log_file, "a", encoding="utf-8") as f:
                 f.write(f"[{ts}] {msg}\n")
         except Exception:
-            pass
+            # Directory may have been removed; recreate it on the next call
+            _ensured_dirs.discard(out_dir)
 
 
 def log_with_emoji(msg: str, emoji: str, out_dir: Optional[str] = None) -> None:
@@ -5,13 +5,14 @@ Tests FileScanner and ExcelLoader classes with various scenarios
 including empty directories, valid/invalid files, and data validation.
 """
 
+import os
 import sys
 import tempfile
 import time
 import unittest
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pandas as pd
 
@@ -29,8 +30,11 @@ if str(src_path) not in sys.path:
 
 # Now we can safely import dashboard modules
 from quickbooks_autoreport.dashboard.data_loader import (  # noqa: E402
+    PARQUET_CACHE_ENABLED,
     ExcelLoader,
     FileScanner,
+    _load_excel_cached,
+    _prefetch_executor,
 )
 
 
@@ -137,6 +141,17 @@ class TestFileScanner(unittest.TestCase):
         self.assertEqual(len(files), 1)
         self.assertEqual(files[0].name, "sales.xlsx")
 
+    def test_list_excel_file_info(self):
+        """Test listing files with size and modification time."""
+        test_file = self.temp_dir / "sales.xlsx"
+        pd.DataFrame({"A": [1]}).to_excel(test_file, index=False)
+
+        infos = self.scanner.list_excel_file_info()
+        self.assertEqual(len(infos), 1)
+        self.assertEqual(infos[0].name, "sales.xlsx")
+        self.assertEqual(infos[0].size, test_file.stat().st_size)
+        self.assertEqual(infos[0].mtime, test_file.stat().st_mtime)
+
     def test_list_excel_files_nonexistent_directory(self):
         """Test that FileNotFoundError is raised for nonexistent directory."""
         nonexistent_dir = Path("/nonexistent/directory/path")
@@ -179,6 +194,18 @@ class TestFileScanner(unittest.TestCase):
             self.scanner.get_file_modified_time(nonexistent_file)
         self.assertIn("File not found", str(context.exception))
 
+    def test_stat_once(self):
+        """Test stat_once returns stats, or None for a missing file."""
+        test_file = self.temp_dir / "test.xlsx"
+        test_file.write_bytes(b"data")
+
+        file_stats = self.scanner.stat_once(test_file)
+
+        self.assertEqual(file_stats.st_size, 4)
+        self.assertIsNone(
+            self.scanner.stat_once(self.temp_dir / "nonexistent.xlsx")
+        )
+
     def test_file_exists_returns_true_for_existing_file(self):
         """Test file_exists returns True for existing file."""
         test_file = self.temp_dir / "test.xlsx"
@@ -272,6 +299,20 @@ class TestExcelLoader(unittest.TestCase):
             self.loader.load_file(corrupted_file)
         self.assertIn("Failed to read Excel file", str(context.exception))
 
+    def test_load_file_locked_file(self):
+        """Test ValueError raised when the file cannot be opened."""
+        test_file = self.temp_dir / "locked.xlsx"
+        self.sample_valid_data.to_excel(test_file, index=False)
+
+        with patch(
+            'quickbooks_autoreport.dashboard.data_loader.open',
+            side_effect=PermissionError("file is locked"),
+            create=True
+        ):
+            with self.assertRaises(ValueError) as context:
+                self.loader.load_file(test_file, test_file.stat().st_mtime)
+        self.assertIn("Failed to read Excel file", str(context.exception))
+
     def test_validate_columns_all_present(self):
         """Test validation when all required columns are present."""
         is_valid, missing = self.loader.validate_columns(self.sample_valid_data)
@@ -331,12 +372,9 @@ class TestExcelLoader(unittest.TestCase):
 
         self.assertIn('Weekday', df.columns)
         self.assertEqual(len(df), 3)
-        # Verify weekday names are valid
-        valid_weekdays = [
-            'Monday', 'Tuesday', 'Wednesday', 'Thursday',
-            'Friday', 'Saturday', 'Sunday'
-        ]
-        self.assertTrue(all(day in valid_weekdays for day in df['Weekday']))
+        # Verify weekday codes are int8 indexes into WEEKDAY_ORDER
+        self.assertEqual(df['Weekday'].dtype, 'int8')
+        self.assertTrue(all(0 <= day <= 6 for day in df['Weekday']))
 
     def test_add_weekday_column_custom_column_name(self):
         """Test adding weekday column with custom column name."""
@@ -373,8 +411,8 @@ class TestExcelLoader(unittest.TestCase):
         result_df = self.loader.add_weekday_column(df, date_column='Date')
 
         self.assertIn('Weekday', result_df.columns)
-        # Verify conversion worked
-        self.assertEqual(result_df['Weekday'].iloc[0], 'Monday')
+        # Verify conversion worked (2025-10-06 is a Monday)
+        self.assertEqual(result_df['Weekday'].iloc[0], 0)
 
     def test_add_weekday_column_various_date_formats(self):
         """Test weekday extraction with various date formats."""
@@ -447,5 +485,109 @@ class TestExcelLoader(unittest.TestCase):
         )
 
 
+
+@unittest.skipUnless(PARQUET_CACHE_ENABLED, "pyarrow is not installed")
+class TestParquetCache(unittest.TestCase):
+    """Test suite for the Parquet sidecar cache."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir_obj = tempfile.TemporaryDirectory()
+        self.temp_dir = Path(self.temp_dir_obj.name)
+        _load_excel_cached.clear()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        _load_excel_cached.clear()
+        self.temp_dir_obj.cleanup()
+
+    def test_sidecar_not_shared_across_required_columns(self):
+        """Test a loader needing extra columns ignores a narrower cache."""
+        test_file = self.temp_dir / "sales.xlsx"
+        pd.DataFrame({
+            'Sales_Amount': [90.0, 180.0],
+            'Sales_Qty': [10, 20],
+            'Extra_Column': ['a', 'b'],
+        }).to_excel(test_file, index=False, sheet_name='Transactions')
+        file_mtime = test_file.stat().st_mtime
+
+        narrow = ExcelLoader(required_columns=['Sales_Amount'])
+        df = narrow.load_file(test_file, file_mtime)
+        self.assertNotIn('Extra_Column', df.columns)
+
+        wide = ExcelLoader(required_columns=['Extra_Column'])
+        df = wide.load_file(test_file, file_mtime)
+        self.assertIn('Extra_Column', df.columns)
+        self.assertTrue(wide.validate_columns(df)[0])
+
+        self.assertEqual(len(list(self.temp_dir.glob("sales.*.parquet"))), 2)
+
+    def test_replaced_workbook_with_older_mtime_is_reparsed(self):
+        """Test a sidecar is only reused for the exact workbook version."""
+        test_file = self.temp_dir / "sales.xlsx"
+        loader = ExcelLoader(required_columns=['Sales_Amount'])
+
+        pd.DataFrame({'Sales_Amount': [1.0, 2.0]}).to_excel(
+            test_file, index=False, sheet_name='Transactions'
+        )
+        df = loader.load_file(test_file, test_file.stat().st_mtime)
+        self.assertEqual(df['Sales_Amount'].tolist(), [1.0, 2.0])
+
+        # Replace the workbook, keeping an older mtime as a restored
+        # backup would
+        old_mtime = test_file.stat().st_mtime - 3600
+        pd.DataFrame({'Sales_Amount': [5.0, 6.0, 7.0]}).to_excel(
+            test_file, index=False, sheet_name='Transactions'
+        )
+        os.utime(test_file, (old_mtime, old_mtime))
+        df = loader.load_file(test_file, old_mtime)
+        self.assertEqual(df['Sales_Amount'].tolist(), [5.0, 6.0, 7.0])
+
+        # The sidecar of the superseded version is removed
+        self.assertEqual(len(list(self.temp_dir.glob("sales.*.parquet"))), 1)
+
+
+
+class TestPrefetch(unittest.TestCase):
+    """Test suite for background prefetching."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir_obj = tempfile.TemporaryDirectory()
+        self.temp_dir = Path(self.temp_dir_obj.name)
+        _load_excel_cached.clear()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        _load_excel_cached.clear()
+        self.temp_dir_obj.cleanup()
+
+    def test_prefetch_fills_load_cache_without_script_run_context(self):
+        """Test a prefetch on the context-less worker serves load_file."""
+        test_file = self.temp_dir / "sales.xlsx"
+        pd.DataFrame({
+            'Sales_Amount': [90.0, 180.0],
+            'Sales_Qty': [10, 20],
+        }).to_excel(test_file, index=False, sheet_name='Transactions')
+        file_mtime = test_file.stat().st_mtime
+        loader = ExcelLoader(required_columns=['Sales_Amount'])
+
+        loader.prefetch_file(test_file, file_mtime)
+        # The single worker runs jobs in order, so this waits for the
+        # prefetch to finish
+        _prefetch_executor.submit(lambda: None).result()
+
+        with patch(
+            'quickbooks_autoreport.dashboard.data_loader.pd.read_excel'
+        ) as read_excel, patch(
+            'quickbooks_autoreport.dashboard.data_loader._read_parquet_cache'
+        ) as read_parquet:
+            df = loader.load_file(test_file, file_mtime)
+
+        read_excel.assert_not_called()
+        read_parquet.assert_not_called()
+        self.assertEqual(df['Sales_Amount'].tolist(), [90.0, 180.0])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -84,6 +84,25 @@ def test_validate_invalid_query_type_raises():
     assert raised, "Expected ValueError for invalid query_type"
 
 
+def test_validate_reports_query_type_before_empty_filenames():
+    cfg = ReportConfig(
+        key="k",
+        name="Name",
+        qbxml_type="SomeType",
+        query_type="NotAValidType",
+        csv_filename="",
+        excel_filename="",
+        hash_filename="a.hash",
+        request_log="req.xml",
+        response_log="resp.xml",
+        uses_date_range=False,
+    )
+    try:
+        cfg.validate()
+        assert False, "Expected ValueError for invalid query_type"
+    except ValueError as e:
+        assert "Invalid query_type" in str(e)
+
 def test_validate_missing_required_fields_raise():
     # Empty key
     cfg = ReportConfig(
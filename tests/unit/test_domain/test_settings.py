@@ -82,6 +82,14 @@ def test_missing_company_file_raises_value_error(tmp_path):
     assert raised
 
 
+def test_existing_company_file_validates(tmp_path):
+    company = tmp_path / "company.qbw"
+    company.write_bytes(b"")
+    s = Settings(company_file=str(company))
+    s.validate()
+    s.validate()
+
+
 def test_ensure_output_directory_creates(tmp_path):
     out_dir = tmp_path / "sub"
     s = Settings(output_dir=str(out_dir))
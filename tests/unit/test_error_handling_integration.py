@@ -236,9 +236,7 @@ class TestErrorRecovery:
 
         state = DashboardState()
         file_scanner = MagicMock()
-        file_scanner.get_file_modified_time.side_effect = Exception(
-            "Test error"
-        )
+        file_scanner.stat_once.side_effect = Exception("Test error")
 
         # Should return False instead of crashing
         result = state.should_reload(file_scanner)
@@ -250,7 +248,7 @@ class TestErrorRecovery:
 
         state = DashboardState(current_file=Path("test.xlsx"))
         file_scanner = MagicMock()
-        file_scanner.file_exists.return_value = False
+        file_scanner.stat_once.return_value = None
 
         # Should return False instead of crashing
         result = state.should_reload(file_scanner)
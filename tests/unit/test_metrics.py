@@ -319,6 +319,20 @@ def test_aggregate_by_weekday_chronological_order() -> None:
     assert actual_order == expected_order
 
 
+def test_aggregate_by_weekday_integer_codes() -> None:
+    """Test weekday aggregation with int8 codes from ExcelLoader."""
+    df = pd.DataFrame({
+        'Sales_Amount': [100.0, 200.0, 150.0, 50.0],
+        'Weekday': pd.Series([6, 0, 6, -1], dtype='int8')
+    })
+    calculator = MetricsCalculator(df)
+    weekday_agg = calculator.aggregate_by_weekday('Sales_Amount')
+
+    # Missing dates (-1) are dropped and codes map back to names
+    assert weekday_agg['Weekday'].tolist() == ['Monday', 'Sunday']
+    assert weekday_agg['Sales_Amount'].tolist() == [200.0, 250.0]
+
+
 def test_aggregate_by_weekday_missing_value_column() -> None:
     """Test weekday aggregation when value column is missing."""
     df = pd.DataFrame({'Weekday': ['Monday', 'Tuesday']})
@@ -2,6 +2,7 @@
 
 from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pandas as pd
@@ -135,8 +136,9 @@ class TestDashboardState:
         )
 
         file_scanner = Mock()
-        file_scanner.file_exists.return_value = True
-        file_scanner.get_file_modified_time.return_value = datetime.fromtimestamp(2000.0)
+        file_scanner.stat_once.return_value = SimpleNamespace(
+            st_mtime=2000.0, st_mtime_ns=2000 * 10**9
+        )
 
         assert state.should_reload(file_scanner) is True
 
@@ -149,8 +151,9 @@ class TestDashboardState:
         )
 
         file_scanner = Mock()
-        file_scanner.file_exists.return_value = True
-        file_scanner.get_file_modified_time.return_value = datetime.fromtimestamp(1000.0)
+        file_scanner.stat_once.return_value = SimpleNamespace(
+            st_mtime=1000.0, st_mtime_ns=1000 * 10**9
+        )
 
         assert state.should_reload(file_scanner) is False
 
@@ -163,7 +166,7 @@ class TestDashboardState:
         )
 
         file_scanner = Mock()
-        file_scanner.file_exists.return_value = False
+        file_scanner.stat_once.return_value = None
 
         assert state.should_reload(file_scanner) is False
 
@@ -176,7 +179,6 @@ class TestDashboardState:
         )
 
         file_scanner = Mock()
-        file_scanner.file_exists.return_value = True
-        file_scanner.get_file_modified_time.side_effect = Exception("Error")
+        file_scanner.stat_once.side_effect = Exception("Error")
 
         assert state.should_reload(file_scanner) is False
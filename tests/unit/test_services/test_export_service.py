@@ -0,0 +1,53 @@
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Ensure 'src' is importable
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "src"))
+
+openpyxl = pytest.importorskip("openpyxl")
+
+from quickbooks_autoreport.config import get_file_paths  # noqa: E402
+from quickbooks_autoreport.services import export_service  # noqa: E402
+
+REPORT_KEY = "sales_by_item"
+HEADERS = ["Item", "Amount"]
+
+
+def _sheet_value(out_dir):
+    wb = openpyxl.load_workbook(get_file_paths(out_dir, REPORT_KEY)["excel_file"])
+    return wb.active["B2"].value
+
+
+def test_unchanged_data_rebuilds_workbook_after_failed_export(tmp_path):
+    out_dir = str(tmp_path)
+    export = export_service.export_report_with_change_detection
+
+    first = export(HEADERS, [["Widget", "v1"]], out_dir, REPORT_KEY)
+    assert first["changed"] and first["excel_created"]
+
+    # The hash for v2 is saved, but the workbook rebuild fails (e.g. the
+    # file is open in Excel)
+    with patch.object(export_service, "export_to_excel", return_value=False):
+        second = export(HEADERS, [["Widget", "v2"]], out_dir, REPORT_KEY)
+    assert second["changed"] and not second["excel_created"]
+    assert _sheet_value(out_dir) == "v1"
+
+    third = export(HEADERS, [["Widget", "v2"]], out_dir, REPORT_KEY)
+    assert not third["changed"]
+    assert third["excel_created"]
+    assert _sheet_value(out_dir) == "v2"
+
+
+def test_unchanged_data_keeps_current_workbook(tmp_path):
+    out_dir = str(tmp_path)
+    export = export_service.export_report_with_change_detection
+
+    export(HEADERS, [["Widget", "v1"]], out_dir, REPORT_KEY)
+    with patch.object(export_service, "export_to_excel") as rebuild:
+        result = export(HEADERS, [["Widget", "v1"]], out_dir, REPORT_KEY)
+
+    rebuild.assert_not_called()
+    assert not result["changed"] and result["excel_created"]
@@ -11,6 +11,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from quickbooks_autoreport.dashboard.data_loader import FileInfo
 from quickbooks_autoreport.dashboard.sidebar import (
     _render_file_selector,
     _render_status_section,
@@ -66,6 +67,7 @@ class TestRenderFileSelector:
         available_files = [file1, file2, file3]
         current_file = file2
 
+        mock_st.session_state = {}
         mock_st.selectbox.return_value = "sales_feb.xlsx"
 
         # Act
@@ -76,6 +78,25 @@ class TestRenderFileSelector:
         call_args = mock_st.selectbox.call_args
         assert call_args[1]['index'] == 1  # file2 is at index 1
 
+    @patch('quickbooks_autoreport.dashboard.sidebar.st')
+    def test_session_state_selection_sets_default(self, mock_st):
+        """Test remembered filename in session state sets default index."""
+        # Arrange
+        file1 = Path("output/sales_jan.xlsx")
+        file2 = Path("output/sales_feb.xlsx")
+        available_files = [file1, file2]
+
+        mock_st.session_state = {"selected_filename": "sales_feb.xlsx"}
+        mock_st.selectbox.return_value = "sales_feb.xlsx"
+
+        # Act
+        result = _render_file_selector(available_files, None)
+
+        # Assert
+        assert result == file2
+        assert mock_st.selectbox.call_args[1]['index'] == 1
+        assert mock_st.session_state["selected_filename"] == "sales_feb.xlsx"
+
     @patch('quickbooks_autoreport.dashboard.sidebar.st')
     def test_file_selection_change(self, mock_st):
         """Test changing file selection."""
@@ -239,3 +260,37 @@ class TestRenderFileMetadata:
         assert mock_st.metric.call_count == 1
         call_args = mock_st.metric.call_args
         assert call_args[1]['label'] == "Last Modified"
+
+    @patch('quickbooks_autoreport.dashboard.sidebar.os.stat')
+    @patch('quickbooks_autoreport.dashboard.sidebar.st')
+    def test_details_hidden_skips_stat(self, mock_st, mock_stat):
+        """Test collapsed file details do no stat or metric work."""
+        # Arrange
+        mock_st.toggle.return_value = False
+
+        # Act
+        render_file_metadata(Path("output/hidden.xlsx"))
+
+        # Assert
+        mock_st.subheader.assert_called_once_with("📄 File Information")
+        mock_stat.assert_not_called()
+        mock_st.metric.assert_not_called()
+
+    @patch('quickbooks_autoreport.dashboard.sidebar.os.stat')
+    @patch('quickbooks_autoreport.dashboard.sidebar.st')
+    def test_file_info_renders_without_stat(self, mock_st, mock_stat):
+        """Test precomputed FileInfo metadata needs no stat call."""
+        # Arrange
+        file_info = FileInfo(
+            path=Path("output/sales.xlsx"),
+            size=2048,
+            mtime=datetime(2025, 10, 8, 17, 0, 4).timestamp()
+        )
+
+        # Act
+        render_file_metadata(file_info)
+
+        # Assert
+        mock_stat.assert_not_called()
+        values = [call[1]['value'] for call in mock_st.metric.call_args_list]
+        assert values == ["2.00 KB", "2025-10-08 17:00:04"]
@@ -8,6 +8,8 @@ and logging setup.
 import logging
 from datetime import datetime
 
+import pandas as pd
+
 from src.quickbooks_autoreport.dashboard.utils import (
     format_currency,
     format_date_range,
@@ -17,8 +19,10 @@ from src.quickbooks_autoreport.dashboard.utils import (
     format_file_not_found_message,
     format_missing_columns_message,
     format_number,
+    format_number_series,
     format_timestamp,
     format_units,
+    get_dashboard_logger,
     log_error,
     log_loading,
     log_processing,
@@ -84,6 +88,21 @@ class TestNumberFormatting:
         """Test number formatting rounds correctly."""
         assert format_number(1234.999, decimals=2) == "1,235.00"
 
+    def test_format_number_series(self):
+        """Test vectorized whole-number formatting."""
+        result = format_number_series(pd.Series([1234.5, 0, 1000000]))
+        assert result.tolist() == ["1,234", "0", "1,000,000"]
+
+    def test_format_number_series_keeps_missing_values(self):
+        """Test missing values pass through vectorized formatting."""
+        result = format_number_series(pd.Series([1234.5, None, 7.0]))
+        assert result[[0, 2]].tolist() == ["1,234", "7"]
+        assert pd.isna(result[1])
+
+        result = format_number_series(pd.Series([1000, pd.NA], dtype="Int64"))
+        assert result[0] == "1,000"
+        assert pd.isna(result[1])
+
     def test_format_units(self):
         """Test units formatting."""
         assert format_units(1234.5) == "1,234"
@@ -213,6 +232,13 @@ class TestLoggingSetup:
         logger2 = setup_logger(logger_name)
         assert len(logger2.handlers) == handler_count
 
+    def test_get_dashboard_logger_cached(self):
+        """Test dashboard logger is configured once and reused."""
+        logger1 = get_dashboard_logger("test_dashboard_logger")
+        logger2 = get_dashboard_logger("test_dashboard_logger")
+        assert logger1 is logger2
+        assert len(logger1.handlers) == 1
+
     def test_log_loading(self, caplog):
         """Test loading log message."""
         logger = setup_logger("test_loading")